@@ -1,6 +1,16 @@
-from importlib.metadata import PackageNotFoundError, version
+# importlib.metadata is slow to import, so __version__ is resolved on first access
+# rather than on every `chaos` invocation.
 
-try:
-    __version__ = version("chaoscatcher")
-except PackageNotFoundError:
-    __version__ = "unknown"
+
+def __getattr__(name: str) -> str:
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        value = version("chaoscatcher")
+    except PackageNotFoundError:
+        value = "unknown"
+    globals()["__version__"] = value
+    return value
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
 
 
 def _now_local() -> datetime:
@@ -10,18 +12,104 @@ def _now_local() -> datetime:
 
 
 def _fmt_time(dt: datetime) -> str:
-    # Windows-safe formatting
-    try:
-        return dt.strftime("%-I:%M %p")
-    except ValueError:
-        return dt.strftime("%I:%M %p").lstrip("0")
+    # "7:05 PM" — plain int formatting: portable (no %-I) and skips strftime entirely
+    h = dt.hour
+    return f"{h % 12 or 12}:{dt.minute:02d} {'AM' if h < 12 else 'PM'}"
 
 
 def _dt_from_entry_ts(ts: str) -> datetime | None:
+    if not isinstance(ts, str):
+        return None
+    return _parse_entry_ts(ts)
+
+
+# Stored ts strings are re-parsed by every command/refresh that touches an entry;
+# datetimes are immutable, so sharing one parse per string is safe. Sized to hold a
+# large personal log so full-history scans still hit.
+@lru_cache(maxsize=16384)
+def _parse_entry_ts(ts: str) -> datetime | None:
+    # Every ISO form starts with a 4-digit year: skip the raise/catch for anything else.
+    if not ts[:4].isdigit():
+        return None
     try:
-        dt = datetime.fromisoformat(ts)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=_now_local().tzinfo)
-        return dt.astimezone()
-    except Exception:
+        # naive stamps are local wall time: astimezone() applies the zone's rules for that date
+        return datetime.fromisoformat(ts).astimezone()
+    except (ValueError, OverflowError):  # bad fields / out-of-range after tz shift
+        return None
+
+
+def _ts_floor(cutoff: datetime | None) -> str:
+    """
+    ISO string that every stored ts on/after cutoff compares >= to, whatever its UTC
+    offset (two days of slack); "" when there is no cutoff.
+    Lets loops reject older entries with a string compare instead of a parse.
+    """
+    if cutoff is None:
+        return ""
+    return (cutoff - timedelta(days=2)).isoformat()
+
+
+_TAG_TRANS = str.maketrans(",", " ")
+
+
+def _parse_tags(raw: str | None) -> list[str]:
+    if not raw:
+        return []
+    # case-insensitive dedupe in one pass; the first spelling of each tag wins
+    seen: dict[str, str] = {}
+    for p in raw.translate(_TAG_TRANS).split():
+        seen.setdefault(p.lower(), p)
+    return list(seen.values())
+
+
+def _daily_slope(ys: list[float]) -> float:
+    """
+    Least-squares slope of ys against x = 0, 1, ..., n-1.
+    x is evenly spaced, so its mean and spread are closed-form and only ys is walked.
+    """
+    n = len(ys)
+    if n < 2:
+        return 0.0
+    x_mean = (n - 1) / 2
+    y_mean = sum(ys) / n
+    num = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(ys))
+    den = n * (n * n - 1) / 12
+    return num / den
+
+
+_DURATION_RE = re.compile(r"(?:\d+[hm])+")
+_DURATION_PART_RE = re.compile(r"(\d+)([hm])")
+_DURATION_TRAILING_RE = re.compile(r"(?:\d+[hm])+\d+")
+
+
+def _parse_duration(value: str | None) -> int | None:
+    """
+    Sleep duration in minutes: "90", "7:30" (H:MM) or "7h30m" / "7h" / "30m"; None if blank.
+    Raises ValueError("Bad H:MM format" / "Trailing number without unit" / "Bad duration").
+    """
+    if value is None:
+        return None
+    s = str(value).strip().lower()
+    if not s:
         return None
+
+    if ":" in s:
+        parts = s.split(":")
+        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
+            h = int(parts[0])
+            m = int(parts[1])
+            if m < 0 or m >= 60 or h < 0:
+                raise ValueError("Bad H:MM format")
+            return h * 60 + m
+        raise ValueError("Bad H:MM format")
+
+    if s.isdigit():
+        return int(s)
+
+    # "7h30m" variants; spaces are ignored anywhere
+    s = s.replace(" ", "")
+    if _DURATION_RE.fullmatch(s):
+        return sum(int(n) * (60 if unit == "h" else 1) for n, unit in _DURATION_PART_RE.findall(s))
+    if _DURATION_TRAILING_RE.fullmatch(s):
+        raise ValueError("Trailing number without unit")
+    raise ValueError("Bad duration")
@@ -1,18 +1,19 @@
 from __future__ import annotations
 
 import argparse
-import csv
+import heapq
 import os
-import stat
-from datetime import datetime, timedelta
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
 from typing import Any
 
-from ._util import _dt_from_entry_ts, _fmt_time, _now_local
+from ._util import _daily_slope, _dt_from_entry_ts, _fmt_time, _now_local, _parse_duration, _parse_tags, _ts_floor
 from .paths import resolve_data_path
 from .safety import assert_safe_data_path
-from .storage import load_json, save_json
-from .timeparse import parse_ts
+from .storage import append_entry, journal_status, load_json, load_json_readonly, save_json
 
 # -------------------------
 # Time helpers
@@ -32,6 +33,9 @@ def _parse_ts(value: str | None) -> str:
     """
     if not value:
         return _now_iso()
+    # only the add commands parse user times; keep the format tables off the startup path
+    from .timeparse import parse_ts
+
     return parse_ts(value)
 
 
@@ -48,42 +52,162 @@ def _window_cutoff(window: str) -> tuple[datetime | None, str]:
     return None, "all time"
 
 
+def _ts_key(m: dict[str, Any]) -> str:
+    return str(m.get("ts", ""))
+
+
+def _ts_sorted(entries: list[dict[str, Any]]) -> bool:
+    """True if entries are in non-decreasing ts order (the normal append-only case)."""
+    prev = ""
+    for m in entries:
+        ts = str(m.get("ts", ""))
+        if ts < prev:
+            return False
+        prev = ts
+    return True
+
+
+def _dated_entries(
+    entries: list[dict[str, Any]], cutoff: datetime | None = None
+) -> list[tuple[datetime, dict[str, Any]]]:
+    """
+    Parse every entry's ts exactly once, in a single pass:
+    - entries with a missing/unparseable ts are dropped
+    - entries before cutoff (if given) are dropped
+    Returns (dt, entry) pairs in input order.
+    """
+    parse = _dt_from_entry_ts
+    floor = _ts_floor(cutoff)
+    out: list[tuple[datetime, dict[str, Any]]] = []
+    for m in entries:
+        ts = m.get("ts")
+        if not isinstance(ts, str) or ts < floor:
+            continue
+        dt = parse(ts)
+        if dt is None or (cutoff is not None and dt < cutoff):
+            continue
+        out.append((dt, m))
+    return out
+
+
+def _day_bounds(day: date) -> tuple[datetime, datetime]:
+    """Local [midnight, next midnight) for day, so per-entry checks are plain datetime compares."""
+    return (
+        datetime.combine(day, time.min).astimezone(),
+        datetime.combine(day + timedelta(days=1), time.min).astimezone(),
+    )
+
+
+def _today_entries(entries: list[dict[str, Any]], today: date) -> list[tuple[datetime, dict[str, Any]]]:
+    """
+    (dt, entry) pairs whose local date is today, in input order.
+    One pass: a string compare against _ts_floor rejects anything older than two
+    days before today without parsing it, so only recent entries are parsed,
+    whatever order (e.g. backdated) the log is in.
+    """
+    start, end = _day_bounds(today)
+    return [(dt, m) for dt, m in _dated_entries(entries, start) if dt < end]
+
+
+def _pair_ts_key(pair: tuple[datetime, dict[str, Any]]) -> str:
+    return _ts_key(pair[1])
+
+
+def _newest(entries: list[Any], limit: int, key: Any = _ts_key) -> list[Any]:
+    """
+    Newest-first by ts, capped at limit: same result (and tie order) as
+    sorted(entries, key=ts, reverse=True)[:limit], without sorting the whole log.
+    Pass key=_pair_ts_key to rank (dt, entry) pairs.
+    """
+    if limit < 0:
+        return sorted(entries, key=key, reverse=True)[:limit]
+    return heapq.nlargest(limit, entries, key=key)
+
+
+def _scored_entries(
+    moods: list[dict[str, Any]], cutoff: datetime | None = None
+) -> list[tuple[datetime, int, dict[str, Any]]]:
+    """
+    Like _dated_entries, but keeps only moods with a valid 1–10 int score.
+    The score is checked first so the (much pricier) ts parse is skipped for rejects.
+    Returns (dt, score, entry) triples in input order.
+    """
+    parse = _dt_from_entry_ts
+    floor = _ts_floor(cutoff)
+    out: list[tuple[datetime, int, dict[str, Any]]] = []
+    for m in moods:
+        s = m.get("score")
+        if not isinstance(s, int) or not (1 <= s <= 10):
+            continue
+        ts = m.get("ts")
+        if not isinstance(ts, str):
+            continue
+        ts = ts.strip()  # the exports have always accepted hand-edited, padded stamps
+        if ts < floor:
+            continue
+        dt = parse(ts)
+        if dt is None or (cutoff is not None and dt < cutoff):
+            continue
+        out.append((dt, s, m))
+    return out
+
+
+def _recent_score_days(moods: list[dict[str, Any]], n: int) -> dict[str, list[int]]:
+    """
+    day -> valid scores, for the n most recent local days that have any.
+    On sorted logs, scan newest-first and stop once safely before the n-th newest day
+    (same two days of slack as _ts_floor); otherwise group every scored entry.
+    """
+    by_day: dict[str, list[int]] = {}
+    if not _ts_sorted(moods):
+        for dt, s, _ in _scored_entries(moods):
+            by_day.setdefault(dt.date().isoformat(), []).append(s)
+    else:
+        floor = ""
+        for m in reversed(moods):
+            if _ts_key(m) < floor:
+                break
+            s = m.get("score")
+            if not isinstance(s, int) or not (1 <= s <= 10):
+                continue
+            dt = _dt_from_entry_ts(m.get("ts"))
+            if dt is None:
+                continue
+            day = dt.date().isoformat()
+            vals = by_day.get(day)
+            if vals is not None:
+                vals.append(s)
+                continue
+            by_day[day] = [s]
+            if len(by_day) >= n:
+                nth = min(heapq.nlargest(n, by_day))
+                start = datetime.combine(date.fromisoformat(nth), time.min).astimezone()
+                floor = (start - timedelta(days=2)).isoformat()
+    return {d: by_day[d] for d in heapq.nlargest(n, by_day)}
+
+
 # -------------------------
 # Formatting helpers
 # -------------------------
 
 
-def _parse_tags(raw: str | None) -> list[str]:
-    if not raw:
-        return []
-    parts: list[str] = []
-    for chunk in raw.replace(",", " ").split():
-        c = chunk.strip()
-        if c:
-            parts.append(c)
-    seen = set()
-    out: list[str] = []
-    for p in parts:
-        key = p.lower()
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(p)
-    return out
+_SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
 
 
 def _sparkline(values: list[float], vmin: float = 1.0, vmax: float = 10.0) -> str:
     if not values:
         return ""
-    blocks = "▁▂▃▄▅▆▇█"
+    blocks = _SPARK_BLOCKS
+    top = len(blocks) - 1
     span = max(1e-9, vmax - vmin)
-    out = []
-    for v in values:
-        x = (v - vmin) / span
-        idx = int(round(x * (len(blocks) - 1)))
-        idx = max(0, min(len(blocks) - 1, idx))
-        out.append(blocks[idx])
-    return "".join(out)
+    return "".join([blocks[max(0, min(top, round((v - vmin) / span * top)))] for v in values])
+
+
+# _parse_duration's errors -> CLI message template
+_MINUTES_ERRORS = {
+    "Bad H:MM format": "{arg} must be minutes, or H:MM like 7:30",
+    "Trailing number without unit": "{arg}: trailing number without unit in {value!r}",
+}
 
 
 def _parse_minutes(value: str | None, arg_name: str) -> int | None:
@@ -95,65 +219,11 @@ def _parse_minutes(value: str | None, arg_name: str) -> int | None:
       - "7h30m" / "7h" / "30m" -> parsed
     Returns minutes as int, or raises SystemExit on bad format.
     """
-    if value is None:
-        return None
-
-    s = str(value).strip().lower()
-    if not s:
-        return None
-
-    # 1) H:MM
-    if ":" in s:
-        parts = s.split(":")
-        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
-            h = int(parts[0])
-            m = int(parts[1])
-            if m < 0 or m >= 60 or h < 0:
-                raise SystemExit(f"{arg_name} must be minutes, or H:MM like 7:30")
-            return h * 60 + m
-        raise SystemExit(f"{arg_name} must be minutes, or H:MM like 7:30")
-
-    # 2) plain minutes
-    if s.isdigit():
-        return int(s)
-
-    # 3) "7h30m" variants
-    total = 0
-    num = ""
-    saw_unit = False
-
-    def flush(unit: str) -> None:
-        nonlocal total, num, saw_unit
-        if not num:
-            raise SystemExit(f"{arg_name}: bad duration {value!r}")
-        n = int(num)
-        if unit == "h":
-            total += n * 60
-        elif unit == "m":
-            total += n
-        else:
-            raise SystemExit(f"{arg_name}: bad duration {value!r}")
-        num = ""
-        saw_unit = True
-
-    for ch in s:
-        if ch.isdigit():
-            num += ch
-            continue
-        if ch in ("h", "m"):
-            flush(ch)
-            continue
-        if ch in (" ",):
-            continue
-        raise SystemExit(f"{arg_name} must be minutes, H:MM, or like 7h30m (got {value!r})")
-
-    if num:
-        # if they wrote "7" but not digits-only (handled above), treat as error
-        if saw_unit:
-            raise SystemExit(f"{arg_name}: trailing number without unit in {value!r}")
-        raise SystemExit(f"{arg_name} must be minutes, H:MM, or like 7h30m (got {value!r})")
-
-    return total if saw_unit else None
+    try:
+        return _parse_duration(value)
+    except ValueError as e:
+        tpl = _MINUTES_ERRORS.get(str(e), "{arg} must be minutes, H:MM, or like 7h30m (got {value!r})")
+        raise SystemExit(tpl.format(arg=arg_name, value=value)) from None
 
 
 # -------------------------
@@ -161,40 +231,55 @@ def _parse_minutes(value: str | None, arg_name: str) -> int | None:
 # -------------------------
 
 
-def _print_med_block(entry: dict[str, Any]) -> None:
-    dt = _dt_from_entry_ts(str(entry.get("ts", "")))
-    if dt:
-        d = dt.date().isoformat()
-        t = _fmt_time(dt)
-    else:
-        d = "unknown-date"
-        t = "unknown-time"
+def _write_lines(lines: list[str]) -> None:
+    """Emit a whole report with one write instead of a print() per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    name = str(entry.get("name", "")).strip()
-    dose = str(entry.get("dose", "")).strip()
-    notes = str(entry.get("notes", "")).strip()
 
-    print("```")
-    print("📒 Medication Log")
-    print(f"- 📅 Date: {d}")
-    print(f"- 🕒 Time: {t}")
-    print(f"- 💊 Medication: {name}")
-    print(f"- 🧪 Dose: {dose}")
-    if notes:
-        print(f"- 📝 Notes: {notes}")
-    print("```")
+_MOOD_BLOCK_TPL = (
+    "```\n"
+    "📒 Mood Log\n"
+    "- 📅 Date: {d}\n"
+    "- 🕒 Time: {t}\n"
+    "- 🙂 Mood (1–10): {score}\n"
+    "{tags_line}"
+    "{sleep_line}"
+    "{notes_line}"
+    "```\n"
+)
 
 
-def _print_mood_block(entry: dict[str, Any]) -> None:
-    dt = _dt_from_entry_ts(str(entry.get("ts", "")))
+def _block_date_time(entry: dict[str, Any]) -> tuple[str, str]:
+    dt = _dt_from_entry_ts(entry.get("ts"))
     if dt:
-        d = dt.date().isoformat()
-        t = _fmt_time(dt)
-    else:
-        d = "unknown-date"
-        t = "unknown-time"
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}", _fmt_time(dt)
+    return "unknown-date", "unknown-time"
+
+
+def _format_med_block(entry: dict[str, Any]) -> str:
+    get = entry.get
+    d, t = _block_date_time(entry)
+    notes = str(get("notes", "")).strip()
+    notes_line = f"- 📝 Notes: {notes}\n" if notes else ""
+
+    return (
+        "```\n"
+        "📒 Medication Log\n"
+        f"- 📅 Date: {d}\n"
+        f"- 🕒 Time: {t}\n"
+        f"- 💊 Medication: {str(get('name', '')).strip()}\n"
+        f"- 🧪 Dose: {str(get('dose', '')).strip()}\n"
+        f"{notes_line}"
+        "```\n"
+    )
+
+
+def _print_med_block(entry: dict[str, Any]) -> None:
+    sys.stdout.write(_format_med_block(entry))
 
-    score = entry.get("score", None)
+
+def _format_mood_block(entry: dict[str, Any]) -> str:
+    d, t = _block_date_time(entry)
     notes = str(entry.get("notes", "")).strip()
     tags = entry.get("tags", [])
 
@@ -202,23 +287,29 @@ def _print_mood_block(entry: dict[str, Any]) -> None:
     sleep_rem = entry.get("sleep_rem_min")
     sleep_deep = entry.get("sleep_deep_min")
 
-    print("```")
-    print("📒 Mood Log")
-    print(f"- 📅 Date: {d}")
-    print(f"- 🕒 Time: {t}")
-    print(f"- 🙂 Mood (1–10): {score}")
-    if tags:
-        print(f"- 🏷️ Tags: {', '.join(tags)}")
+    sleep_line = ""
     if sleep_total is not None or sleep_rem is not None or sleep_deep is not None:
-        print(
+        sleep_line = (
             "- 😴 Sleep (minutes): "
             f"total={sleep_total if sleep_total is not None else '—'}, "
             f"REM={sleep_rem if sleep_rem is not None else '—'}, "
-            f"deep={sleep_deep if sleep_deep is not None else '—'}"
+            f"deep={sleep_deep if sleep_deep is not None else '—'}\n"
         )
-    if notes:
-        print(f"- 📝 Notes: {notes}")
-    print("```")
+
+    return _MOOD_BLOCK_TPL.format_map(
+        {
+            "d": d,
+            "t": t,
+            "score": entry.get("score", None),
+            "tags_line": f"- 🏷️ Tags: {', '.join(tags)}\n" if tags else "",
+            "sleep_line": sleep_line,
+            "notes_line": f"- 📝 Notes: {notes}\n" if notes else "",
+        }
+    )
+
+
+def _print_mood_block(entry: dict[str, Any]) -> None:
+    sys.stdout.write(_format_mood_block(entry))
 
 
 # -------------------------
@@ -253,13 +344,34 @@ MOOD_DAILY_CSV_FIELDS = [
 ]
 
 
-def _write_csv(out_path: Path, fieldnames: list[str], rows: list[dict[str, Any]]) -> None:
+# strftime("%a") in the C locale, indexed by datetime.weekday()
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def _fmt_utcoffset(offset: timedelta | None) -> str:
+    """Same text as strftime("%z") (+HHMM, +HHMMSS for second-level offsets) without strftime."""
+    if offset is None:
+        return ""
+    sign = "-" if offset < timedelta(0) else "+"
+    minutes, seconds = divmod(abs(int(offset.total_seconds())), 60)
+    hours, minutes = divmod(minutes, 60)
+    if seconds:
+        return f"{sign}{hours:02d}{minutes:02d}{seconds:02d}"
+    return f"{sign}{hours:02d}{minutes:02d}"
+
+
+def _write_csv(out_path: Path, fieldnames: list[str], rows: Iterable[tuple[Any, ...]]) -> None:
+    """
+    Rows are tuples already in fieldnames order (no per-row key lookups).
+    rows may be a generator; it is streamed straight into the file.
+    """
+    import csv  # only the export commands need it
+
     out_path.parent.mkdir(parents=True, exist_ok=True)
     with out_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL)
-        w.writeheader()
-        if rows:
-            w.writerows(rows)
+        w = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+        w.writerow(fieldnames)
+        w.writerows(rows)
 
 
 # -------------------------
@@ -268,17 +380,17 @@ def _write_csv(out_path: Path, fieldnames: list[str], rows: list[dict[str, Any]]
 
 
 def cmd_med_add(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
-    meds = data.setdefault("medications", [])
-
     ts = _parse_ts(args.time)
 
-    entry: dict[str, Any] = {"ts": ts, "name": args.name, "dose": args.dose}
-    if args.notes:
-        entry["notes"] = args.notes
+    entry: dict[str, Any] = {
+        "ts": ts,
+        "name": args.name,
+        "dose": args.dose,
+        **({"notes": args.notes} if args.notes else {}),
+    }
 
-    meds.append(entry)
-    save_json(args.data_path, data)
+    # Journal append: O(1) instead of re-serializing the whole store.
+    append_entry(args.data_path, "medications", entry)
 
     if args.format == "block":
         _print_med_block(entry)
@@ -287,30 +399,32 @@ def cmd_med_add(args: argparse.Namespace) -> None:
 
 
 def cmd_med_list(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
+    data = load_json_readonly(args.data_path)
     meds = data.get("medications", [])
 
     if not meds:
         print("No medication entries yet.")
         return
 
-    meds_sorted = sorted(meds, key=lambda m: str(m.get("ts", "")), reverse=True)
+    meds_sorted = _newest(meds, args.limit)
 
     if args.format == "block":
-        for m in meds_sorted[: args.limit]:
-            _print_med_block(m)
+        # one write for the whole listing instead of one per block
+        sys.stdout.write("".join(map(_format_med_block, meds_sorted)))
         return
 
-    print("=== Medication Log (newest first) ===")
-    for m in meds_sorted[: args.limit]:
+    lines: list[str] = ["=== Medication Log (newest first) ==="]
+    for m in meds_sorted:
         line = f"{m.get('ts', '')} — {m.get('name', '')} {m.get('dose', '')}".strip()
         if m.get("notes"):
             line += f" ({m['notes']})"
-        print(line)
+        lines.append(line)
+
+    _write_lines(lines)
 
 
 def cmd_med_today(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
+    data = load_json_readonly(args.data_path)
     meds = data.get("medications", [])
 
     if not meds:
@@ -318,36 +432,32 @@ def cmd_med_today(args: argparse.Namespace) -> None:
         return
 
     today = _now_local().date()
-    todays: list[dict[str, Any]] = []
-
-    for m in meds:
-        dt = _dt_from_entry_ts(str(m.get("ts", "")))
-        if dt and dt.date() == today:
-            todays.append(m)
+    todays = _today_entries(meds, today)
 
     if not todays:
         print("No medication entries logged today.")
         return
 
-    todays_sorted = sorted(todays, key=lambda m: str(m.get("ts", "")), reverse=True)
+    todays_sorted = _newest(todays, args.limit, key=_pair_ts_key)
 
     if args.format == "block":
-        for m in todays_sorted[: args.limit]:
-            _print_med_block(m)
+        # one write for the whole listing instead of one per block
+        sys.stdout.write("".join(_format_med_block(m) for _, m in todays_sorted))
         return
 
-    print(f"=== Medication Log (today: {today.isoformat()}) ===")
-    for m in todays_sorted[: args.limit]:
-        dt = _dt_from_entry_ts(str(m.get("ts", "")))
-        t = _fmt_time(dt) if dt else ""
-        line = f"{t} — {m.get('name', '')} {m.get('dose', '')}"
+    lines: list[str] = [f"=== Medication Log (today: {today.isoformat()}) ==="]
+    # reuse the datetimes parsed while filtering
+    for dt, m in todays_sorted:
+        line = f"{_fmt_time(dt)} — {m.get('name', '')} {m.get('dose', '')}"
         if m.get("notes"):
             line += f" ({m['notes']})"
-        print(line)
+        lines.append(line)
+
+    _write_lines(lines)
 
 
 def cmd_med_stats(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
+    data = load_json_readonly(args.data_path)
     meds = data.get("medications", [])
 
     if not meds:
@@ -357,34 +467,27 @@ def cmd_med_stats(args: argparse.Namespace) -> None:
     now = _now_local()
     cutoff = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=args.days - 1)
 
-    counts: dict[str, int] = {}
-    hour_counts: dict[int, int] = {}
-
-    for m in meds:
-        name = str(m.get("name", "Unknown")).strip() or "Unknown"
-        dt = _dt_from_entry_ts(str(m.get("ts", "")))
-        if not dt or dt < cutoff:
-            continue
-
-        counts[name] = counts.get(name, 0) + 1
-        hour_counts[dt.hour] = hour_counts.get(dt.hour, 0) + 1
+    recent = _dated_entries(meds, cutoff)
+    counts = Counter(str(m.get("name", "Unknown")).strip() or "Unknown" for _, m in recent)
+    hour_counts = Counter(dt.hour for dt, _ in recent)
 
     if not counts:
         print(f"No medication entries found in last {args.days} days.")
         return
 
-    print(f"=== Medication Stats (last {args.days} days, since {cutoff.date().isoformat()}) ===")
-    print("\n[Counts by medication]")
+    lines: list[str] = [f"=== Medication Stats (last {args.days} days, since {cutoff.date().isoformat()}) ==="]
+    lines.append("\n[Counts by medication]")
     for name, c in sorted(counts.items(), key=lambda x: (-x[1], x[0].lower())):
-        print(f"- {name}: {c}")
+        lines.append(f"- {name}: {c}")
 
-    print("\n[Most common hours]")
-    top_hours = sorted(hour_counts.items(), key=lambda x: -x[1])[:5]
-    for h, c in top_hours:
-        # %-I is linux-only; use helper with safe fallback
-        label = _fmt_time(datetime(2000, 1, 1, h, 0).astimezone())
+    lines.append("\n[Most common hours]")
+    for h, c in hour_counts.most_common(5):
+        # %-I is linux-only; use helper with safe fallback (wall-clock only, no tz lookup needed)
+        label = _fmt_time(datetime(2000, 1, 1, h, 0))
         label = label.replace(":00", "")  # cosmetic: "3 PM"
-        print(f"- {label}: {c}")
+        lines.append(f"- {label}: {c}")
+
+    _write_lines(lines)
 
 
 # -------------------------
@@ -396,9 +499,6 @@ def cmd_mood_add(args: argparse.Namespace) -> None:
     if not (1 <= args.score <= 10):
         raise SystemExit("--score must be between 1 and 10")
 
-    data = load_json(args.data_path)
-    moods = data.setdefault("moods", [])
-
     ts = _parse_ts(args.time)
     entry: dict[str, Any] = {"ts": ts, "score": int(args.score)}
 
@@ -408,6 +508,8 @@ def cmd_mood_add(args: argparse.Namespace) -> None:
     tags = _parse_tags(args.tags)
     if tags:
         entry["tags"] = tags
+        # dedupe key form, computed here once instead of on every dedupe
+        entry["_tags_norm"] = sorted(t.lower() for t in tags)
 
     # Sleep fields (minutes)
     sleep_total = _parse_minutes(args.sleep_total, "--sleep-total")
@@ -421,8 +523,8 @@ def cmd_mood_add(args: argparse.Namespace) -> None:
     if sleep_deep is not None:
         entry["sleep_deep_min"] = sleep_deep
 
-    moods.append(entry)
-    save_json(args.data_path, data)
+    # Journal append: O(1) instead of re-serializing the whole store.
+    append_entry(args.data_path, "moods", entry)
 
     if args.format == "block":
         _print_mood_block(entry)
@@ -431,22 +533,22 @@ def cmd_mood_add(args: argparse.Namespace) -> None:
 
 
 def cmd_mood_list(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
+    data = load_json_readonly(args.data_path)
     moods = data.get("moods", [])
 
     if not moods:
         print("No mood entries yet.")
         return
 
-    moods_sorted = sorted(moods, key=lambda m: str(m.get("ts", "")), reverse=True)
+    moods_sorted = _newest(moods, args.limit)
 
     if args.format == "block":
-        for m in moods_sorted[: args.limit]:
-            _print_mood_block(m)
+        # one write for the whole listing instead of one per block
+        sys.stdout.write("".join(map(_format_mood_block, moods_sorted)))
         return
 
-    print("=== Mood Log (newest first) ===")
-    for m in moods_sorted[: args.limit]:
+    lines: list[str] = ["=== Mood Log (newest first) ==="]
+    for m in moods_sorted:
         ts = str(m.get("ts", ""))
         score = m.get("score", "")
         notes = m.get("notes")
@@ -464,11 +566,13 @@ def cmd_mood_list(args: argparse.Namespace) -> None:
             sr_s = f"{sr}m" if sr is not None else "—"
             sd_s = f"{sd}m" if sd is not None else "—"
             line += f" [sleep total={st_s} rem={sr_s} deep={sd_s}]"
-        print(line)
+        lines.append(line)
+
+    _write_lines(lines)
 
 
 def cmd_mood_today(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
+    data = load_json_readonly(args.data_path)
     moods = data.get("moods", [])
 
     if not moods:
@@ -476,28 +580,23 @@ def cmd_mood_today(args: argparse.Namespace) -> None:
         return
 
     today = _now_local().date()
-    todays: list[dict[str, Any]] = []
-
-    for m in moods:
-        dt = _dt_from_entry_ts(str(m.get("ts", "")))
-        if dt and dt.date() == today:
-            todays.append(m)
+    todays = _today_entries(moods, today)
 
     if not todays:
         print("No mood entries logged today.")
         return
 
-    todays_sorted = sorted(todays, key=lambda m: str(m.get("ts", "")), reverse=True)
+    todays_sorted = _newest(todays, args.limit, key=_pair_ts_key)
 
     if args.format == "block":
-        for m in todays_sorted[: args.limit]:
-            _print_mood_block(m)
+        # one write for the whole listing instead of one per block
+        sys.stdout.write("".join(_format_mood_block(m) for _, m in todays_sorted))
         return
 
-    print(f"=== Mood Log (today: {today.isoformat()}) ===")
-    for m in todays_sorted[: args.limit]:
-        dt = _dt_from_entry_ts(str(m.get("ts", "")))
-        t = _fmt_time(dt) if dt else ""
+    lines: list[str] = [f"=== Mood Log (today: {today.isoformat()}) ==="]
+    # reuse the datetimes parsed while filtering
+    for dt, m in todays_sorted:
+        t = _fmt_time(dt)
         tags = m.get("tags", [])
         notes = m.get("notes")
         line = f"{t} — {m.get('score', '')}/10"
@@ -513,29 +612,44 @@ def cmd_mood_today(args: argparse.Namespace) -> None:
             sr_s = f"{sr}m" if sr is not None else "—"
             sd_s = f"{sd}m" if sd is not None else "—"
             line += f" [sleep total={st_s} rem={sr_s} deep={sd_s}]"
-        print(line)
+        lines.append(line)
 
+    _write_lines(lines)
 
-def cmd_mood_reset(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
-    before = len(data.get("moods", []))
 
+def cmd_mood_reset(args: argparse.Namespace) -> None:
     if not args.yes:
         raise SystemExit("Refusing to reset without --yes (this deletes mood history).")
 
+    data = load_json(args.data_path)
+    before = len(data.get("moods", []))
+
     data["moods"] = []
     save_json(args.data_path, data)
     print(f"🧹 Mood reset: deleted {before} entries.")
 
 
+def _norm_tags(tags: list[Any]) -> tuple[str, ...]:
+    """Sorted, stripped, lowercased tags (dedupe key form)."""
+    return tuple(sorted(str(t).strip().lower() for t in tags if str(t).strip()))
+
+
+def _join_tags(tags: list[Any]) -> str:
+    """Stripped, non-empty tags joined for CSV output."""
+    return ", ".join(str(t).strip() for t in tags if str(t).strip())
+
+
 def _mood_key(entry: dict[str, Any]) -> tuple:
     ts = str(entry.get("ts", ""))
     score = int(entry.get("score", 0)) if isinstance(entry.get("score"), int) else entry.get("score")
     notes = str(entry.get("notes", "")).strip()
-    tags = entry.get("tags", [])
-    if not isinstance(tags, list):
-        tags = []
-    tags_norm = tuple(sorted(str(t).strip().lower() for t in tags if str(t).strip()))
+    tags_norm = entry.get("_tags_norm")
+    if isinstance(tags_norm, list):
+        tags_norm = tuple(tags_norm)  # normalized once by cmd_mood_add
+    else:
+        # older entries and GUI-logged ones
+        tags = entry.get("tags", [])
+        tags_norm = _norm_tags(tags if isinstance(tags, list) else [])
     sleep_total = entry.get("sleep_total_min")
     sleep_rem = entry.get("sleep_rem_min")
     sleep_deep = entry.get("sleep_deep_min")
@@ -576,7 +690,7 @@ def cmd_mood_dedupe(args: argparse.Namespace) -> None:
 
 
 def cmd_mood_stats(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
+    data = load_json_readonly(args.data_path)
     moods = data.get("moods", [])
 
     if not moods:
@@ -585,45 +699,41 @@ def cmd_mood_stats(args: argparse.Namespace) -> None:
 
     cutoff, label = _window_cutoff(args.window)
 
-    recent: list[tuple[datetime, dict[str, Any]]] = []
-    for m in moods:
-        dt = _dt_from_entry_ts(str(m.get("ts", "")))
-        if not dt:
-            continue
-        if cutoff and dt < cutoff:
-            continue
-        recent.append((dt, m))
+    recent = _dated_entries(moods, cutoff)
 
     if not recent:
         print(f"No mood entries found for {label}.")
         return
 
-    by_day: dict[str, list[int]] = {}
-    tag_counts: dict[str, int] = {}
+    # day -> [sum, count]; scores are accumulated as they stream past instead of
+    # being collected into per-day lists.
+    by_day: defaultdict[str, list[int]] = defaultdict(lambda: [0, 0])
+    tag_counts: Counter[str] = Counter()
+    dist: Counter[int] = Counter()
 
     for dt, m in recent:
         s = m.get("score")
         if isinstance(s, int) and 1 <= s <= 10:
-            day = dt.date().isoformat()
-            by_day.setdefault(day, []).append(s)
+            acc = by_day[dt.date().isoformat()]
+            acc[0] += s
+            acc[1] += 1
+            dist[s] += 1
+
+        tag_counts.update(map(str, m.get("tags", []) or []))
 
-        for t in m.get("tags", []) or []:
-            tag_counts[str(t)] = tag_counts.get(str(t), 0) + 1
+    n_scores = dist.total()
 
     if not by_day:
         print(f"No valid mood scores found for {label}.")
         return
 
     days_sorted = sorted(by_day.keys())
-    daily_avgs = [(d, sum(by_day[d]) / len(by_day[d])) for d in days_sorted]
+    daily_avgs = [(d, by_day[d][0] / by_day[d][1]) for d in days_sorted]
 
     scores = [avg for _, avg in daily_avgs]
     avg = sum(scores) / len(scores)
-    mn = min(scores)
-    mx = max(scores)
 
     n = len(daily_avgs)
-    xs = list(range(n))
     ys = scores
 
     if n == 1:
@@ -631,11 +741,7 @@ def cmd_mood_stats(args: argparse.Namespace) -> None:
         direction = "→ stable (not enough data)"
         net = 0.0
     else:
-        x_mean = sum(xs) / n
-        y_mean = sum(ys) / n
-        num = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
-        den = sum((x - x_mean) ** 2 for x in xs)
-        slope = (num / den) if den else 0.0
+        slope = _daily_slope(ys)
 
         eps = args.trend_epsilon
         if slope > eps:
@@ -647,188 +753,145 @@ def cmd_mood_stats(args: argparse.Namespace) -> None:
 
         net = ys[-1] - ys[0]
 
-    dist: dict[int, int] = {i: 0 for i in range(1, 11)}
-    raw_scores: list[int] = []
-    for _, m in recent:
-        s = m.get("score")
-        if isinstance(s, int) and 1 <= s <= 10:
-            raw_scores.append(s)
-            dist[s] += 1
-
     best_day = max(daily_avgs, key=lambda x: x[1])
     worst_day = min(daily_avgs, key=lambda x: x[1])
+    # the daily extremes are just the best/worst day values; no extra passes
+    mn = worst_day[1]
+    mx = best_day[1]
 
-    print(f"=== Mood Stats ({label}) ===")
+    lines: list[str] = [f"=== Mood Stats ({label}) ==="]
     if cutoff:
-        print(f"- since: {cutoff.date().isoformat()}")
-    print(f"- entries: {len(raw_scores)}")
-    print(f"- days with data: {len(daily_avgs)}")
-    print(f"- average (daily): {avg:.2f}/10")
-    print(f"- min/max (daily): {mn:.2f}/10 … {mx:.2f}/10")
-    print(f"- best day (avg): {best_day[0]} = {best_day[1]:.2f}/10")
-    print(f"- worst day (avg): {worst_day[0]} = {worst_day[1]:.2f}/10")
-
-    print("\n[TREND]")
-    print(f"- direction: {direction}")
-    print(f"- slope: {slope:+.3f} mood points/day (epsilon={args.trend_epsilon})")
-    print(f"- net change: {net:+.2f} (first day avg → last day avg)")
-    print(f"- sparkline: {_sparkline(scores)}")
-
-    print("\n[Daily averages]")
+        lines.append(f"- since: {cutoff.date().isoformat()}")
+    lines.append(f"- entries: {n_scores}")
+    lines.append(f"- days with data: {len(daily_avgs)}")
+    lines.append(f"- average (daily): {avg:.2f}/10")
+    lines.append(f"- min/max (daily): {mn:.2f}/10 … {mx:.2f}/10")
+    lines.append(f"- best day (avg): {best_day[0]} = {best_day[1]:.2f}/10")
+    lines.append(f"- worst day (avg): {worst_day[0]} = {worst_day[1]:.2f}/10")
+
+    lines.append("\n[TREND]")
+    lines.append(f"- direction: {direction}")
+    lines.append(f"- slope: {slope:+.3f} mood points/day (epsilon={args.trend_epsilon})")
+    lines.append(f"- net change: {net:+.2f} (first day avg → last day avg)")
+    lines.append(f"- sparkline: {_sparkline(scores)}")
+
+    lines.append("\n[Daily averages]")
     for d, a in daily_avgs:
-        print(f"- {d}: {a:.2f}/10 ({len(by_day[d])} entries)")
+        lines.append(f"- {d}: {a:.2f}/10 ({by_day[d][1]} entries)")
 
-    print("\n[Score distribution (raw entries)]")
+    lines.append("\n[Score distribution (raw entries)]")
     for i in range(1, 11):
         bar = "▇" * min(dist[i], 30)
-        print(f"{i:>2}: {dist[i]:>3} {bar}")
+        lines.append(f"{i:>2}: {dist[i]:>3} {bar}")
 
     if tag_counts:
-        print("\n[Top tags]")
-        top = sorted(tag_counts.items(), key=lambda x: -x[1])[:10]
-        for t, c in top:
-            print(f"- {t}: {c}")
-
-
-def cmd_mood_export(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
-    moods = data.get("moods", [])
-
-    cutoff, label = _window_cutoff(args.window)
-
-    rows: list[dict[str, Any]] = []
+        lines.append("\n[Top tags]")
+        for t, c in tag_counts.most_common(10):
+            lines.append(f"- {t}: {c}")
 
-    for m in moods:
-        ts = str(m.get("ts", "")).strip()
-        dt = _dt_from_entry_ts(ts)
-        if not dt:
-            continue
-        if cutoff and dt < cutoff:
-            continue
+    _write_lines(lines)
 
-        score = m.get("score")
-        if not isinstance(score, int) or not (1 <= score <= 10):
-            continue
 
+def _mood_csv_rows(entries: list[tuple[datetime, int, dict[str, Any]]]) -> Iterator[tuple[Any, ...]]:
+    """Yield one MOOD_CSV_FIELDS-ordered row per (dt, score, entry) from _scored_entries."""
+    for dt, score, m in entries:
         tags = m.get("tags", [])
         if not isinstance(tags, list):
             tags = []
-        tags_str = ", ".join(str(t).strip() for t in tags if str(t).strip())
 
-        notes = str(m.get("notes", "")).strip()
-
-        rows.append(
-            {
-                "ts": ts,
-                "date": dt.date().isoformat(),
-                "time": dt.strftime("%H:%M"),
-                "timezone": dt.strftime("%z"),
-                "weekday": dt.strftime("%a"),
-                "score": score,
-                "sleep_total_min": m.get("sleep_total_min", ""),
-                "sleep_rem_min": m.get("sleep_rem_min", ""),
-                "sleep_deep_min": m.get("sleep_deep_min", ""),
-                "tags": tags_str,
-                "notes": notes,
-            }
+        yield (
+            str(m.get("ts", "")).strip(),
+            dt.date().isoformat(),
+            f"{dt.hour:02d}:{dt.minute:02d}",
+            _fmt_utcoffset(dt.utcoffset()),
+            _WEEKDAYS[dt.weekday()],
+            score,
+            m.get("sleep_total_min", ""),
+            m.get("sleep_rem_min", ""),
+            m.get("sleep_deep_min", ""),
+            _join_tags(tags),
+            str(m.get("notes", "")).strip(),
         )
 
+
+def cmd_mood_export(args: argparse.Namespace) -> None:
+    data = load_json_readonly(args.data_path)
+    moods = data.get("moods", [])
+
+    cutoff, label = _window_cutoff(args.window)
+
+    entries = _scored_entries(moods, cutoff)
+
     out_path = Path(args.csv).expanduser().resolve()
-    _write_csv(out_path, MOOD_CSV_FIELDS, rows)
+    _write_csv(out_path, MOOD_CSV_FIELDS, _mood_csv_rows(entries))
 
-    if rows:
-        print(f"📄 Exported {len(rows)} mood rows ({label}) → {out_path}")
+    if entries:
+        print(f"📄 Exported {len(entries)} mood rows ({label}) → {out_path}")
     else:
         print(f"📄 Exported header-only mood CSV (no rows for {label}) → {out_path}")
 
 
 def cmd_mood_export_daily(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
+    data = load_json_readonly(args.data_path)
     moods = data.get("moods", [])
 
     cutoff, label = _window_cutoff(args.window)
 
-    by_day_scores: dict[str, list[int]] = {}
-    by_day_tags: dict[str, list[str]] = {}
-    by_day_sleep_total: dict[str, list[int]] = {}
-    by_day_sleep_rem: dict[str, list[int]] = {}
-    by_day_sleep_deep: dict[str, list[int]] = {}
-
-    for m in moods:
-        ts = str(m.get("ts", "")).strip()
-        dt = _dt_from_entry_ts(ts)
-        if not dt:
-            continue
-        if cutoff and dt < cutoff:
-            continue
-
-        s = m.get("score")
-        if not isinstance(s, int) or not (1 <= s <= 10):
-            continue
+    # day -> aggregates for that day, filled in a single pass over the entries
+    by_day: dict[str, dict[str, Any]] = {}
 
+    for dt, s, m in _scored_entries(moods, cutoff):
         day = dt.date().isoformat()
-        by_day_scores.setdefault(day, []).append(s)
+        agg = by_day.get(day)
+        if agg is None:
+            agg = by_day[day] = {
+                "weekday": _WEEKDAYS[dt.weekday()],
+                "scores": [],
+                "tags": Counter(),
+                "sleep_total_min": [],
+                "sleep_rem_min": [],
+                "sleep_deep_min": [],
+            }
+        agg["scores"].append(s)
 
         tags = m.get("tags", [])
         if isinstance(tags, list):
-            for t in tags:
-                tt = str(t).strip()
-                if tt:
-                    by_day_tags.setdefault(day, []).append(tt)
+            agg["tags"].update(filter(None, (str(t).strip() for t in tags)))
 
-        st = m.get("sleep_total_min")
-        if isinstance(st, int) and st >= 0:
-            by_day_sleep_total.setdefault(day, []).append(st)
-
-        sr = m.get("sleep_rem_min")
-        if isinstance(sr, int) and sr >= 0:
-            by_day_sleep_rem.setdefault(day, []).append(sr)
-
-        sd = m.get("sleep_deep_min")
-        if isinstance(sd, int) and sd >= 0:
-            by_day_sleep_deep.setdefault(day, []).append(sd)
+        for key in ("sleep_total_min", "sleep_rem_min", "sleep_deep_min"):
+            v = m.get(key)
+            if isinstance(v, int) and v >= 0:
+                agg[key].append(v)
 
     def _avg(xs: list[int]) -> str:
         if not xs:
             return ""
         return f"{(sum(xs) / len(xs)):.2f}"
 
-    rows: list[dict[str, Any]] = []
-    for day in sorted(by_day_scores.keys()):
-        scores = by_day_scores[day]
+    rows: list[tuple[Any, ...]] = []
+    for day in sorted(by_day.keys()):
+        agg = by_day[day]
+        scores = agg["scores"]
         avg = sum(scores) / len(scores)
-        mn = min(scores)
-        mx = max(scores)
-        entries = len(scores)
 
-        tlist = by_day_tags.get(day, [])
         top_tags = ""
-        if tlist:
-            counts: dict[str, int] = {}
-            for t in tlist:
-                counts[t] = counts.get(t, 0) + 1
-            top = sorted(counts.items(), key=lambda x: -x[1])[:5]
-            top_tags = ", ".join(f"{t}({c})" for t, c in top)
-
-        wd = ""
-        try:
-            wd = datetime.fromisoformat(day).strftime("%a")
-        except Exception:
-            wd = ""
+        if agg["tags"]:
+            top_tags = ", ".join(f"{t}({c})" for t, c in agg["tags"].most_common(5))
 
+        # Column order must match MOOD_DAILY_CSV_FIELDS.
         rows.append(
-            {
-                "date": day,
-                "weekday": wd,
-                "avg_score": f"{avg:.2f}",
-                "min_score": mn,
-                "max_score": mx,
-                "entries": entries,
-                "avg_sleep_total_min": _avg(by_day_sleep_total.get(day, [])),
-                "avg_sleep_rem_min": _avg(by_day_sleep_rem.get(day, [])),
-                "avg_sleep_deep_min": _avg(by_day_sleep_deep.get(day, [])),
-                "tags_top": top_tags,
-            }
+            (
+                day,
+                agg["weekday"],
+                f"{avg:.2f}",
+                min(scores),
+                max(scores),
+                len(scores),
+                _avg(agg["sleep_total_min"]),
+                _avg(agg["sleep_rem_min"]),
+                _avg(agg["sleep_deep_min"]),
+                top_tags,
+            )
         )
 
     out_path = Path(args.csv).expanduser().resolve()
@@ -846,6 +909,7 @@ def cmd_mood_export_daily(args: argparse.Namespace) -> None:
 
 
 def cmd_init(args: argparse.Namespace) -> None:
+    # load + save also folds any journaled adds into the data file
     data = load_json(args.data_path)
     data.setdefault("daily_logs", {})
     data.setdefault("water", [])
@@ -871,6 +935,8 @@ def cmd_where(args: argparse.Namespace) -> None:
 
 
 def cmd_doctor(args: argparse.Namespace) -> None:
+    import stat
+
     print("=== ChaosCatcher Doctor ===")
 
     assert_safe_data_path(args.data_path, args.allow_repo_data_path)
@@ -887,61 +953,251 @@ def cmd_doctor(args: argparse.Namespace) -> None:
     except FileNotFoundError:
         print("⚠️ Data file missing (run `cc init`)")
 
+    size, pending = journal_status(args.data_path)
+    if pending:
+        print(f"📓 Journal: {size} bytes, {pending} entries not in the data file yet (`chaos init` folds them in)")
+    elif size:
+        print(f"📓 Journal: {size} bytes, all folded into the data file")
+    else:
+        print("📓 Journal: empty")
+
     print("=== Done ===")
 
 
 def cmd_summary(args: argparse.Namespace) -> None:
-    data = load_json(args.data_path)
+    data = load_json_readonly(args.data_path)
 
-    print("====================")
-    print("ChaosCatcher Summary")
-    print("====================\n")
+    lines: list[str] = ["===================="]
+    lines.append("ChaosCatcher Summary")
+    lines.append("====================\n")
 
-    print("[DATA PATH]")
-    print(args.data_path, "\n")
+    lines.append("[DATA PATH]")
+    lines.append(f"{args.data_path} \n")
 
-    print("[MOOD – last 7 days]")
+    lines.append("[MOOD – last 7 days]")
     moods = data.get("moods", [])
     if moods:
-        by_day: dict[str, list[int]] = {}
-        for m in moods:
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
-            if not dt:
-                continue
-            day = dt.date().isoformat()
-            s = m.get("score")
-            if isinstance(s, int) and 1 <= s <= 10:
-                by_day.setdefault(day, []).append(s)
+        by_day = _recent_score_days(moods, 7)
 
-        days = sorted(by_day.keys())[-7:]
+        days = sorted(by_day)
         if not days:
-            print("No mood entries yet.")
+            lines.append("No mood entries yet.")
         else:
             for d in days:
                 vals = by_day[d]
                 avg = sum(vals) / len(vals)
-                print(f"- {d}: {avg:.2f}/10 ({len(vals)} entries)")
+                lines.append(f"- {d}: {avg:.2f}/10 ({len(vals)} entries)")
     else:
-        print("No mood entries yet.")
+        lines.append("No mood entries yet.")
 
-    print("\n[MEDICATION – today]")
+    lines.append("\n[MEDICATION – today]")
     meds = data.get("medications", [])
-    today = _now_local().date().isoformat()
-    todays = []
-    for m in meds:
-        dt = _dt_from_entry_ts(str(m.get("ts", "")))
-        if dt and dt.date().isoformat() == today:
-            todays.append(m)
+    today = _now_local().date()
+    todays = _today_entries(meds, today)
     if todays:
-        for m in reversed(todays):
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
-            t = _fmt_time(dt) if dt else ""
-            print(f"- {t}: {m.get('name', '')} {m.get('dose', '')}")
+        for dt, m in reversed(todays):
+            lines.append(f"- {_fmt_time(dt)}: {m.get('name', '')} {m.get('dose', '')}")
     else:
-        print("No meds logged today.")
+        lines.append("No meds logged today.")
 
+    _write_lines(lines)
 
-def main(argv=None) -> None:
+
+# Sub-subcommands in help order; a known leaf lets main() build just that parser.
+_MED_LEAVES = ("add", "list", "today", "stats")
+_MOOD_LEAVES = ("add", "list", "today", "stats", "export", "export-daily", "reset", "dedupe")
+
+
+def _add_med_commands(sub: argparse._SubParsersAction, leaf: str | None = None) -> None:
+    med = sub.add_parser("med", help="Medication logging")
+    med_sub = med.add_subparsers(dest="med_cmd", required=True)
+    if leaf is not None:
+        med_sub.metavar = "{" + ",".join(_MED_LEAVES) + "}"
+
+    if leaf in (None, "add"):
+        med_add = med_sub.add_parser("add", help="Add medication entry")
+        med_add.add_argument("--name", required=True)
+        med_add.add_argument("--dose", required=True)
+        med_add.add_argument("--time", default=None, help="ISO, human, or relative (e.g. today 9am)")
+        med_add.add_argument("--notes", default=None)
+        med_add.add_argument("--format", choices=["line", "block"], default="line")
+        med_add.set_defaults(func=cmd_med_add)
+
+    if leaf in (None, "list"):
+        med_list = med_sub.add_parser("list", help="List medication entries")
+        med_list.add_argument("--limit", type=int, default=50)
+        med_list.add_argument("--format", choices=["line", "block"], default="line")
+        med_list.set_defaults(func=cmd_med_list)
+
+    if leaf in (None, "today"):
+        med_today = med_sub.add_parser("today", help="List today's medication entries")
+        med_today.add_argument("--limit", type=int, default=50)
+        med_today.add_argument("--format", choices=["line", "block"], default="line")
+        med_today.set_defaults(func=cmd_med_today)
+
+    if leaf in (None, "stats"):
+        med_stats = med_sub.add_parser("stats", help="Basic stats for recent medication logs")
+        med_stats.add_argument("--days", type=int, default=14, help="Lookback window (days)")
+        med_stats.set_defaults(func=cmd_med_stats)
+
+
+def _add_mood_commands(sub: argparse._SubParsersAction, leaf: str | None = None) -> None:
+    mood = sub.add_parser("mood", help="Mood tracking + analysis")
+    mood_sub = mood.add_subparsers(dest="mood_cmd", required=True)
+    if leaf is not None:
+        mood_sub.metavar = "{" + ",".join(_MOOD_LEAVES) + "}"
+
+    if leaf in (None, "add"):
+        mood_add = mood_sub.add_parser("add", help="Add mood entry (1–10)")
+        mood_add.add_argument("--score", type=int, required=True, help="Mood score 1–10")
+        mood_add.add_argument(
+            "--time",
+            default=None,
+            help="ISO, human, or relative (e.g. today 9am, 3 days ago)",
+        )
+        mood_add.add_argument("--notes", default=None)
+        mood_add.add_argument(
+            "--tags",
+            default=None,
+            help="Comma or space-separated tags (e.g. baseline,school)",
+        )
+        mood_add.add_argument(
+            "--sleep-total",
+            dest="sleep_total",
+            default=None,
+            help="Total sleep (minutes, H:MM like 7:30, or 7h30m)",
+        )
+        mood_add.add_argument(
+            "--sleep-rem",
+            dest="sleep_rem",
+            default=None,
+            help="REM sleep (minutes, H:MM, or 1h15m)",
+        )
+        mood_add.add_argument(
+            "--sleep-deep",
+            dest="sleep_deep",
+            default=None,
+            help="Deep sleep (minutes, H:MM, or 0h45m)",
+        )
+        mood_add.add_argument("--format", choices=["line", "block"], default="line")
+        mood_add.set_defaults(func=cmd_mood_add)
+
+    if leaf in (None, "list"):
+        mood_list = mood_sub.add_parser("list", help="List mood entries")
+        mood_list.add_argument("--limit", type=int, default=50)
+        mood_list.add_argument("--format", choices=["line", "block"], default="line")
+        mood_list.set_defaults(func=cmd_mood_list)
+
+    if leaf in (None, "today"):
+        mood_today = mood_sub.add_parser("today", help="List today's mood entries")
+        mood_today.add_argument("--limit", type=int, default=50)
+        mood_today.add_argument("--format", choices=["line", "block"], default="line")
+        mood_today.set_defaults(func=cmd_mood_today)
+
+    if leaf in (None, "stats"):
+        mood_stats = mood_sub.add_parser("stats", help="Mood stats + trend over time")
+        mood_stats.add_argument(
+            "--window",
+            choices=["7", "30", "all"],
+            default="7",
+            help="Time window for analysis: 7, 30, or all",
+        )
+        mood_stats.add_argument(
+            "--trend-epsilon",
+            type=float,
+            default=0.05,
+            help="Trend sensitivity in mood points/day (default 0.05)",
+        )
+        mood_stats.set_defaults(func=cmd_mood_stats)
+
+    if leaf in (None, "export"):
+        mood_export = mood_sub.add_parser("export", help="Export mood entries to a clinician-friendly CSV")
+        mood_export.add_argument("--csv", required=True, help="Output CSV path (e.g. ~/moods.csv)")
+        mood_export.add_argument(
+            "--window",
+            choices=["7", "30", "all"],
+            default="30",
+            help="Time window for export: 7, 30, or all (default 30)",
+        )
+        mood_export.set_defaults(func=cmd_mood_export)
+
+    if leaf in (None, "export-daily"):
+        mood_export_daily = mood_sub.add_parser("export-daily", help="Export daily mood summary CSV (avg/min/max)")
+        mood_export_daily.add_argument("--csv", required=True, help="Output CSV path (e.g. ~/moods_daily.csv)")
+        mood_export_daily.add_argument(
+            "--window",
+            choices=["7", "30", "all"],
+            default="30",
+            help="Time window for export: 7, 30, or all (default 30)",
+        )
+        mood_export_daily.set_defaults(func=cmd_mood_export_daily)
+
+    if leaf in (None, "reset"):
+        mood_reset = mood_sub.add_parser("reset", help="Delete ALL mood entries (requires --yes)")
+        mood_reset.add_argument("--yes", action="store_true", help="Confirm destructive reset")
+        mood_reset.set_defaults(func=cmd_mood_reset)
+
+    if leaf in (None, "dedupe"):
+        mood_dedupe = mood_sub.add_parser("dedupe", help="Remove exact duplicate mood entries")
+        mood_dedupe.add_argument("--dry-run", action="store_true", help="Show what would happen without writing")
+        mood_dedupe.set_defaults(func=cmd_mood_dedupe)
+
+
+# Top-level commands in help order; med/mood carry their own sub-subcommands.
+_SIMPLE_COMMANDS = {
+    "init": ("Initialize data store safely", cmd_init),
+    "summary": ("Show summary dashboard", cmd_summary),
+    "where": ("Show which data file is active and why", cmd_where),
+    "doctor": ("Run safety + health checks", cmd_doctor),
+}
+_COMMAND_NAMES = (*_SIMPLE_COMMANDS, "med", "mood")
+
+
+def _add_command(sub: argparse._SubParsersAction, name: str, leaf: str | None = None) -> None:
+    if name == "med":
+        _add_med_commands(sub, leaf)
+    elif name == "mood":
+        _add_mood_commands(sub, leaf)
+    else:
+        help_text, func = _SIMPLE_COMMANDS[name]
+        sub.add_parser(name, help=help_text).set_defaults(func=func)
+
+
+def _command_index(argv: list[str]) -> int | None:
+    it = enumerate(argv)
+    for i, tok in it:
+        if tok == "--":
+            return None
+        if not tok.startswith("-"):
+            return i
+        opt = tok.split("=", 1)[0]
+        if opt == "-h" or (len(opt) > 2 and "--help".startswith(opt)):
+            return None
+        if "=" not in tok and len(opt) > 2 and ("--data".startswith(opt) or "--profile".startswith(opt)):
+            next(it, None)
+    return None
+
+
+def _requested_command(argv: list[str]) -> str | None:
+    """
+    Best-effort peek at the top-level command so main() only builds that subtree.
+    Mirrors argparse for the global options (incl. --opt=value and abbreviations);
+    returns None for help requests or when no command is found, meaning "build all".
+    """
+    i = _command_index(argv)
+    return None if i is None else argv[i]
+
+
+def _requested_leaf(argv: list[str]) -> str | None:
+    """The med/mood sub-subcommand right after the command, if it is a known one."""
+    i = _command_index(argv)
+    if i is None or i + 1 >= len(argv):
+        return None
+    leaves = {"med": _MED_LEAVES, "mood": _MOOD_LEAVES}.get(argv[i], ())
+    return argv[i + 1] if argv[i + 1] in leaves else None
+
+
+def _build_parser(name: str | None, leaf: str | None = None) -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="chaos", description="ChaosCatcher self-care suite")
     p.add_argument("--data", default=None, help="Path to data JSON (overrides env/default)")
     p.add_argument("--profile", default=None, help="Profile name (e.g. dev/test)")
@@ -952,129 +1208,43 @@ def main(argv=None) -> None:
     )
 
     sub = p.add_subparsers(dest="cmd", required=True)
-    sub.add_parser("init", help="Initialize data store safely").set_defaults(func=cmd_init)
-    sub.add_parser("summary", help="Show summary dashboard").set_defaults(func=cmd_summary)
-    sub.add_parser("where", help="Show which data file is active and why").set_defaults(func=cmd_where)
-    sub.add_parser("doctor", help="Run safety + health checks").set_defaults(func=cmd_doctor)
 
-    # ---- med ----
-    med = sub.add_parser("med", help="Medication logging")
-    med_sub = med.add_subparsers(dest="med_cmd", required=True)
+    # Building every subparser dominates startup; only build the one being run
+    # (down to the med/mood leaf when it is known).
+    # Help, typos and missing commands get the full tree so argparse output is unchanged.
+    if name is not None:
+        _add_command(sub, name, leaf)
+        # keep the usage line listing every command
+        sub.metavar = "{" + ",".join(_COMMAND_NAMES) + "}"
+    else:
+        for n in _COMMAND_NAMES:
+            _add_command(sub, n)
+    return p
 
-    med_add = med_sub.add_parser("add", help="Add medication entry")
-    med_add.add_argument("--name", required=True)
-    med_add.add_argument("--dose", required=True)
-    med_add.add_argument("--time", default=None, help="ISO, human, or relative (e.g. today 9am)")
-    med_add.add_argument("--notes", default=None)
-    med_add.add_argument("--format", choices=["line", "block"], default="line")
-    med_add.set_defaults(func=cmd_med_add)
-
-    med_list = med_sub.add_parser("list", help="List medication entries")
-    med_list.add_argument("--limit", type=int, default=50)
-    med_list.add_argument("--format", choices=["line", "block"], default="line")
-    med_list.set_defaults(func=cmd_med_list)
-
-    med_today = med_sub.add_parser("today", help="List today's medication entries")
-    med_today.add_argument("--limit", type=int, default=50)
-    med_today.add_argument("--format", choices=["line", "block"], default="line")
-    med_today.set_defaults(func=cmd_med_today)
-
-    med_stats = med_sub.add_parser("stats", help="Basic stats for recent medication logs")
-    med_stats.add_argument("--days", type=int, default=14, help="Lookback window (days)")
-    med_stats.set_defaults(func=cmd_med_stats)
-
-    # ---- mood ----
-    mood = sub.add_parser("mood", help="Mood tracking + analysis")
-    mood_sub = mood.add_subparsers(dest="mood_cmd", required=True)
 
-    mood_add = mood_sub.add_parser("add", help="Add mood entry (1–10)")
-    mood_add.add_argument("--score", type=int, required=True, help="Mood score 1–10")
-    mood_add.add_argument(
-        "--time",
-        default=None,
-        help="ISO, human, or relative (e.g. today 9am, 3 days ago)",
-    )
-    mood_add.add_argument("--notes", default=None)
-    mood_add.add_argument(
-        "--tags",
-        default=None,
-        help="Comma or space-separated tags (e.g. baseline,school)",
-    )
-    mood_add.add_argument(
-        "--sleep-total",
-        dest="sleep_total",
-        default=None,
-        help="Total sleep (minutes, H:MM like 7:30, or 7h30m)",
-    )
-    mood_add.add_argument(
-        "--sleep-rem",
-        dest="sleep_rem",
-        default=None,
-        help="REM sleep (minutes, H:MM, or 1h15m)",
-    )
-    mood_add.add_argument(
-        "--sleep-deep",
-        dest="sleep_deep",
-        default=None,
-        help="Deep sleep (minutes, H:MM, or 0h45m)",
-    )
-    mood_add.add_argument("--format", choices=["line", "block"], default="line")
-    mood_add.set_defaults(func=cmd_mood_add)
-
-    mood_list = mood_sub.add_parser("list", help="List mood entries")
-    mood_list.add_argument("--limit", type=int, default=50)
-    mood_list.add_argument("--format", choices=["line", "block"], default="line")
-    mood_list.set_defaults(func=cmd_mood_list)
-
-    mood_today = mood_sub.add_parser("today", help="List today's mood entries")
-    mood_today.add_argument("--limit", type=int, default=50)
-    mood_today.add_argument("--format", choices=["line", "block"], default="line")
-    mood_today.set_defaults(func=cmd_mood_today)
-
-    mood_stats = mood_sub.add_parser("stats", help="Mood stats + trend over time")
-    mood_stats.add_argument(
-        "--window",
-        choices=["7", "30", "all"],
-        default="7",
-        help="Time window for analysis: 7, 30, or all",
-    )
-    mood_stats.add_argument(
-        "--trend-epsilon",
-        type=float,
-        default=0.05,
-        help="Trend sensitivity in mood points/day (default 0.05)",
-    )
-    mood_stats.set_defaults(func=cmd_mood_stats)
-
-    mood_export = mood_sub.add_parser("export", help="Export mood entries to a clinician-friendly CSV")
-    mood_export.add_argument("--csv", required=True, help="Output CSV path (e.g. ~/moods.csv)")
-    mood_export.add_argument(
-        "--window",
-        choices=["7", "30", "all"],
-        default="30",
-        help="Time window for export: 7, 30, or all (default 30)",
-    )
-    mood_export.set_defaults(func=cmd_mood_export)
-
-    mood_export_daily = mood_sub.add_parser("export-daily", help="Export daily mood summary CSV (avg/min/max)")
-    mood_export_daily.add_argument("--csv", required=True, help="Output CSV path (e.g. ~/moods_daily.csv)")
-    mood_export_daily.add_argument(
-        "--window",
-        choices=["7", "30", "all"],
-        default="30",
-        help="Time window for export: 7, 30, or all (default 30)",
-    )
-    mood_export_daily.set_defaults(func=cmd_mood_export_daily)
+# Parsers are not modified by parse_args, so in-process callers (tests, scripts)
+# build each one once: keyed by the requested (command, leaf), None for the full tree.
+_PARSERS: dict[tuple[str | None, str | None], argparse.ArgumentParser] = {}
 
-    mood_reset = mood_sub.add_parser("reset", help="Delete ALL mood entries (requires --yes)")
-    mood_reset.add_argument("--yes", action="store_true", help="Confirm destructive reset")
-    mood_reset.set_defaults(func=cmd_mood_reset)
 
-    mood_dedupe = mood_sub.add_parser("dedupe", help="Remove exact duplicate mood entries")
-    mood_dedupe.add_argument("--dry-run", action="store_true", help="Show what would happen without writing")
-    mood_dedupe.set_defaults(func=cmd_mood_dedupe)
+def _get_parser(argv: list[str]) -> argparse.ArgumentParser:
+    name = _requested_command(argv)
+    leaf = None
+    if name not in _COMMAND_NAMES:
+        name = None
+    else:
+        leaf = _requested_leaf(argv)
+    p = _PARSERS.get((name, leaf))
+    if p is None:
+        p = _PARSERS[(name, leaf)] = _build_parser(name, leaf)
+    return p
+
+
+def main(argv=None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
 
-    args = p.parse_args(argv)
+    args = _get_parser(argv).parse_args(argv)
     args.data_arg = args.data
     args.data_path = resolve_data_path(args.data, args.profile)
 
@@ -5,21 +5,28 @@ import io
 import json
 import math
 import os
+import re
 import struct
 import subprocess
 import sys
 import tempfile
 import tkinter as tk
 import wave
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
+from itertools import accumulate
+from operator import sub
 from pathlib import Path
 from tkinter import filedialog, messagebox, simpledialog, ttk
 from typing import Any
 
-from ._util import _dt_from_entry_ts, _fmt_time, _now_local
+from ._util import _daily_slope, _dt_from_entry_ts, _fmt_time, _now_local, _parse_duration, _parse_tags, _ts_floor
 from .paths import resolve_data_path
 from .safety import assert_safe_data_path
-from .storage import load_json, save_json
+from .storage import _JOURNAL_COMPACT_BYTES, append_entry, load_json, save_json, stat_fingerprint
 from .timeparse import parse_ts
 
 
@@ -59,6 +66,17 @@ def _parse_ts(value: str | None) -> str:
         ) from e
 
 
+def _entry_ts_key(e: dict[str, Any]) -> str:
+    return str(e.get("ts", ""))
+
+
+# List rows are rebuilt on every add/delete/refresh, mostly from the same stored ts strings.
+@lru_cache(maxsize=4096)
+def _ts_display(ts: str) -> str:
+    dt = _dt_from_entry_ts(ts)
+    return f"{dt.date().isoformat()} {_fmt_time(dt)}" if dt else ts
+
+
 def _default_daily_med_list() -> list[dict[str, str]]:
     return [
         # {"name": "Vyvanse", "dose": "50 mg"},
@@ -66,71 +84,58 @@ def _default_daily_med_list() -> list[dict[str, str]]:
     ]
 
 
-def _linear_regression_slope(xs: list[float], ys: list[float]) -> float:
-    n = len(xs)
-    if n < 2:
-        return 0.0
-    x_mean = sum(xs) / n
-    y_mean = sum(ys) / n
-    num = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
-    den = sum((x - x_mean) ** 2 for x in xs)
-    return (num / den) if den else 0.0
+def _desc_insert_pos(view: list[dict[str, Any]], entry: dict[str, Any]) -> int:
+    """
+    Row of entry, appended last to its list, in that list's sorted_desc() view:
+    after every entry whose ts sorts >= its own (the reverse sort is stable).
+    """
+    k = _entry_ts_key(entry)
+    lo, hi = 0, len(view)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _entry_ts_key(view[mid]) < k:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
 
 
-def _parse_minutes(value: str | None) -> int | None:
-    if value is None:
-        return None
-    s = str(value).strip().lower()
-    if not s:
-        return None
+def _water_row(w: dict[str, Any]) -> str:
+    return f"{_ts_display(str(w.get('ts', '')))} — {w.get('oz', '')} oz"
 
-    if ":" in s:
-        parts = s.split(":")
-        if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():
-            h = int(parts[0])
-            m = int(parts[1])
-            if m < 0 or m >= 60 or h < 0:
-                raise ValueError("Bad H:MM format")
-            return h * 60 + m
-        raise ValueError("Bad H:MM format")
-
-    if s.isdigit():
-        return int(s)
-
-    total = 0
-    num = ""
-    saw_unit = False
-
-    def flush(unit: str) -> None:
-        nonlocal total, num, saw_unit
-        if not num:
-            raise ValueError("Bad duration")
-        n = int(num)
-        if unit == "h":
-            total += n * 60
-        elif unit == "m":
-            total += n
-        else:
-            raise ValueError("Bad duration")
-        num = ""
-        saw_unit = True
-
-    for ch in s:
-        if ch.isdigit():
-            num += ch
-        elif ch in ("h", "m"):
-            flush(ch)
-        elif ch == " ":
-            continue
-        else:
-            raise ValueError("Bad duration")
 
-    if num:
-        if saw_unit:
-            raise ValueError("Trailing number without unit")
-        raise ValueError("Bad duration")
+def _coerce_oz(v: Any) -> int | None:
+    """Stored oz / goal value: numbers truncate to int, digit strings parse, anything else is None."""
+    if isinstance(v, (int, float)):
+        return int(v)
+    if isinstance(v, str):
+        v = v.strip()
+        if v.isdigit():
+            return int(v)
+    return None
 
-    return total if saw_unit else None
+
+def _same_int(stored: Any, value: int) -> bool:
+    """True if stored is already the int a write of value would store (not a float/bool/str lookalike)."""
+    return type(stored) is int and stored == int(value)
+
+
+def _add_scored(cols: tuple[list[str], list[int]], ts: Any, score: Any) -> None:
+    """Store.scored_moods() step: keep the entry if it has a ts string and a 1–10 score."""
+    if isinstance(ts, str) and isinstance(score, int) and 1 <= score <= 10:
+        cols[0].append(ts)
+        cols[1].append(score)
+
+
+def _add_day_amount(totals: dict[str, int], ts: Any, amount: Any, positive: bool = True) -> None:
+    """Store.day_totals() step: add a numeric (with positive, only a positive) amount to its entry's local day."""
+    n = _coerce_oz(amount)
+    if n is None or (positive and n <= 0) or not isinstance(ts, str):
+        return
+    dt = _dt_from_entry_ts(ts)
+    if dt:
+        day = dt.date().isoformat()
+        totals[day] = totals.get(day, 0) + n
 
 
 def _trend_label_from_slope(slope: float, stable_band: float = 0.02) -> str:
@@ -146,14 +151,19 @@ def _trend_label_from_slope(slope: float, stable_band: float = 0.02) -> str:
 
 
 def _pearson_corr(xs: list[float], ys: list[float]) -> float | None:
+    assert len(xs) == len(ys), "xs and ys must be paired"
     n = len(xs)
     if n < 3:
         return None
     mx = sum(xs) / n
     my = sum(ys) / n
-    num = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
-    denx = sum((x - mx) ** 2 for x in xs)
-    deny = sum((y - my) ** 2 for y in ys)
+    num = denx = deny = 0.0
+    for x, y in zip(xs, ys):
+        dx = x - mx
+        dy = y - my
+        num += dx * dy
+        denx += dx * dx
+        deny += dy * dy
     if denx <= 0 or deny <= 0:
         return None
     return num / ((denx**0.5) * (deny**0.5))
@@ -173,6 +183,27 @@ VY_PHASE_COLORS = {
     "Tail": "#a78bfa",  # violet
 }
 
+# Phase i covers [_VY_PHASE_BOUNDS[i-1], _VY_PHASE_BOUNDS[i]) minutes since the dose
+_VY_PHASE_BOUNDS = (0, 30, 90, 300, 480, 660)
+_VY_PHASE_LABELS = ("Not yet", "Loading", "Onset", "Peak", "Plateau", "Taper", "Tail")
+
+
+def _fmt_hm(minutes: int) -> str:
+    h = minutes // 60
+    m = minutes % 60
+    if h <= 0:
+        return f"{m}m"
+    return f"{h}h {m:02d}m"
+
+
+# "Arc model" lines for the details popup; constant, so formatted once
+_VY_ARC_LINES = tuple(
+    f"• {label}: {_fmt_hm(a)}–{_fmt_hm(b)}"
+    for label, a, b in zip(_VY_PHASE_LABELS[1:], _VY_PHASE_BOUNDS, _VY_PHASE_BOUNDS[1:])
+) + (f"• {_VY_PHASE_LABELS[-1]}: {_fmt_hm(_VY_PHASE_BOUNDS[-1])}+",)
+
+_VY_RE = re.compile("vyv", re.IGNORECASE)  # matches "vyv" and "vyvanse"
+
 
 def _vy_color_for_phase(phase: str) -> str:
     return VY_PHASE_COLORS.get(phase, "#94a3b8")
@@ -196,11 +227,64 @@ MOOD_LINE_GREEN = "#0b6b2a"
 # -------------------------
 
 
+# pointer distance (px) from a mood graph dot's centre that still shows its tooltip
+_GRAPH_HIT_RADIUS = 6
+
+# results kept by _memo_per_day(); one Analyze click fills two
+_MEMO_SIZE = 8
+
+
+def _memo_per_day(method):
+    """
+    Cache a day-granular analysis method(self, *args, data=None, **kwargs) -> str by
+    (Store.version, local date, arguments): nothing else changes its result.
+    Calls passed a data dict other than the current one are computed uncached.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, data=None, **kwargs):
+        current = self.store.load()
+        if data is not None and data is not current:
+            return method(self, *args, data=data, **kwargs)
+        key = (method.__name__, self.store.version, _now_local().date(), args, tuple(sorted(kwargs.items())))
+        memo = self._analysis_memo
+        hit = memo.get(key)
+        if hit is None:
+            hit = method(self, *args, data=current, **kwargs)
+            if len(memo) >= _MEMO_SIZE:
+                del memo[next(iter(memo))]
+            memo[key] = hit
+        return hit
+
+    return wrapper
+
+
 class Store:
     def __init__(self, data_path: Path):
         self.data_path = data_path
+        # (file fingerprint, data) from the last load/save. Handlers call load() for
+        # nearly every UI action; this skips re-parsing until the file changes on disk.
+        self._cache: tuple[Any, dict[str, Any]] | None = None
+        # bumped whenever the data load() returns may differ; see _memo_per_day()
+        self.version = 0
+        # list key -> (data dict it was built from, that list newest-first); see sorted_desc()
+        self._sorted: dict[str, tuple[dict[str, Any], list[dict[str, Any]]]] = {}
+        # (list key, fields) -> (data dict it was built from, one value list per field); see columns()
+        self._columns: dict[tuple[str, tuple[str, ...]], tuple[dict[str, Any], tuple[list[Any], ...]]] = {}
+        # (list key, amount field, positive) -> (data dict it was built from, local day -> total); see day_totals()
+        self._day_totals: dict[tuple[str, str, bool], tuple[dict[str, Any], dict[str, int]]] = {}
+        # (data dict it was built from, (ts, score) columns of the valid moods); see scored_moods()
+        self._scored: tuple[dict[str, Any], tuple[list[str], list[int]]] | None = None
 
     def load(self) -> dict[str, Any]:
+        """
+        The data dict, with defaults filled in.
+        Shared between calls while the file is unchanged: only mutate it to save() it.
+        """
+        key = stat_fingerprint(self.data_path)
+        if self._cache is not None and self._cache[0] == key:
+            return self._cache[1]
+
         try:
             d = load_json(self.data_path)
         except Exception:
@@ -224,10 +308,152 @@ class Store:
 
         d.setdefault("focus_sessions", [])
 
+        if key[0] is None:  # load_json just created the file
+            key = stat_fingerprint(self.data_path)
+        self._cache = (key, d)
+        self.version += 1
         return d
 
     def save(self, data: dict[str, Any]) -> None:
+        # drop first: if the write fails, the next load() re-reads the file
+        self._cache = None
+        self._drop_views()
         save_json(self.data_path, data)
+        self._cache = (stat_fingerprint(self.data_path), data)
+        self.version += 1
+
+    @contextmanager
+    def mutate(self) -> Iterator[dict[str, Any]]:
+        """
+        with store.mutate() as data: edit the live data dict; it is saved when the block completes.
+        If the block raises, the cached dict is dropped so the next load() re-reads the file as saved.
+        """
+        data = self.load()
+        try:
+            yield data
+        except BaseException:
+            self._cache = None
+            self._drop_views()
+            raise
+        self.save(data)
+
+    def append(self, key: str, entry: dict[str, Any]) -> dict[str, Any]:
+        """
+        Add one entry to the data[key] list without rewriting the data file:
+        the entry goes to the storage journal and into the cached dict, which is returned.
+        """
+        data = self.load()
+        self._cache = None
+        self.version += 1
+        view = self._sorted.pop(key, None)
+        if not append_entry(self.data_path, key, entry, into=data):
+            # someone else (e.g. the CLI) wrote since load(): data lacks their lines, so a
+            # fingerprint taken now would vouch for it wrongly. Re-read instead.
+            self._drop_views()
+            return self.load()
+        fp = stat_fingerprint(self.data_path)
+        if fp[1] is not None and fp[1][2] > _JOURNAL_COMPACT_BYTES:
+            self.save(data)  # fold the journal back into the data file
+        else:
+            self._cache = (fp, data)
+        if view is not None and view[0] is data:
+            # keep the sorted view instead of re-sorting it on the next read
+            view[1].insert(_desc_insert_pos(view[1], entry), entry)
+            self._sorted[key] = view
+        for ck, (src, cols) in list(self._columns.items()):
+            if ck[0] != key:
+                continue
+            if src is data:
+                for col, field in zip(cols, ck[1]):
+                    col.append(entry.get(field))
+            else:
+                del self._columns[ck]
+        for dk, (src, totals) in list(self._day_totals.items()):
+            if dk[0] != key:
+                continue
+            if src is data:
+                _add_day_amount(totals, entry.get("ts"), entry.get(dk[1]), dk[2])
+            else:
+                del self._day_totals[dk]
+        if key == "moods" and self._scored is not None:
+            if self._scored[0] is data:
+                _add_scored(self._scored[1], entry.get("ts"), entry.get("score"))
+            else:
+                self._scored = None
+        return data
+
+    def sorted_desc(self, key: str, data: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        """
+        The data[key] entries newest-first by stored ts string, as the GUI lists show them.
+        Built once per data dict and kept in step by append(); dropped on save().
+        Read-only, like the dict itself.
+        """
+        if data is None:
+            data = self.load()
+        hit = self._sorted.get(key)
+        if hit is None or hit[0] is not data:
+            # append-only logs are already in ts order: timsort sees one run and this stays linear
+            hit = (data, sorted(data.get(key, []), key=_entry_ts_key, reverse=True))
+            self._sorted[key] = hit
+        return hit[1]
+
+    def columns(self, key: str, fields: tuple[str, ...], data: dict[str, Any] | None = None) -> tuple[list[Any], ...]:
+        """
+        entry.get(field) for every data[key] entry, one list per field in stored order,
+        so aggregations zip flat lists instead of looking fields up entry by entry.
+        Built once per data dict and kept in step by append(); dropped on save(). Read-only.
+        """
+        if data is None:
+            data = self.load()
+        ck = (key, fields)
+        hit = self._columns.get(ck)
+        if hit is None or hit[0] is not data:
+            entries = data.get(key, [])
+            hit = (data, tuple([e.get(f) for e in entries] for f in fields))
+            self._columns[ck] = hit
+        return hit[1]
+
+    def day_totals(
+        self, key: str, field: str, data: dict[str, Any] | None = None, positive: bool = True
+    ) -> dict[str, int]:
+        """
+        Local day (YYYY-MM-DD) -> sum of the positive entry[field] amounts logged that day,
+        for data[key]; days with nothing positive are absent.
+        positive=False sums every numeric amount instead (hand-edited zero/negative ones too).
+        Built once per data dict and kept in step by append(); dropped on save(). Read-only.
+        """
+        if data is None:
+            data = self.load()
+        dk = (key, field, positive)
+        hit = self._day_totals.get(dk)
+        if hit is None or hit[0] is not data:
+            totals: dict[str, int] = {}
+            for ts, amount in zip(*self.columns(key, ("ts", field), data)):
+                _add_day_amount(totals, ts, amount, positive)
+            hit = (data, totals)
+            self._day_totals[dk] = hit
+        return hit[1]
+
+    def scored_moods(self, data: dict[str, Any] | None = None) -> tuple[list[str], list[int]]:
+        """
+        (ts, score) columns of the moods with a ts string and a 1–10 score, in stored order:
+        validated once per data dict so the mood aggregations can skip the checks.
+        Kept in step by append(); dropped on save(). Read-only.
+        """
+        if data is None:
+            data = self.load()
+        if self._scored is None or self._scored[0] is not data:
+            cols: tuple[list[str], list[int]] = ([], [])
+            for ts, score in zip(*self.columns("moods", ("ts", "score"), data)):
+                _add_scored(cols, ts, score)
+            self._scored = (data, cols)
+        return self._scored[1]
+
+    def _drop_views(self) -> None:
+        self._sorted.clear()
+        self._columns.clear()
+        self._day_totals.clear()
+        self._scored = None
 
 
 class ChaosCatcherApp(tk.Tk):
@@ -238,7 +464,16 @@ class ChaosCatcherApp(tk.Tk):
         self.store = store
 
         self._graph_redraw_job: str | None = None
+        # rows last written to each Listbox, so unchanged refreshes can skip the rebuild
+        self._list_rows: dict[tk.Listbox, list[str]] = {}
+        # data dict the water rows were built from; only then can they be patched in place
+        self._water_list_data: dict[str, Any] | None = None
+        self._analysis_memo: dict[tuple[Any, ...], str] = {}
         self._graph_tooltip: tk.Toplevel | None = None
+        # plotted dots as (x, y, daily_avgs row), x ascending; _graph_xs mirrors the xs for bisect
+        self._graph_points: list[tuple[float, float, tuple[str, float, int, int, int]]] = []
+        self._graph_xs: list[float] = []
+        self._graph_hover: int | None = None  # index of the dot whose tooltip is showing
 
         self._focus_running: bool = False
         self._focus_job: str | None = None
@@ -253,7 +488,15 @@ class ChaosCatcherApp(tk.Tk):
 
         self._refresh_vyvanse_chip()
         self.after(60_000, self._tick_vyvanse_chip)  # update every minute
-        self.after(120, self._draw_mood_graph)
+
+    def _set_list_rows(self, listbox: tk.Listbox, lines: list[str]) -> None:
+        # Unchanged rows: leave the widget alone (keeps selection and scroll position).
+        if self._list_rows.get(listbox) == lines:
+            return
+        listbox.delete(0, tk.END)
+        if lines:
+            listbox.insert(tk.END, *lines)  # one Tcl call for the whole list
+        self._list_rows[listbox] = lines
 
     # -------- Crash guard --------
 
@@ -282,9 +525,6 @@ class ChaosCatcherApp(tk.Tk):
 
         return wrapped
 
-    def _normalize_name(self, s: object) -> str:
-        return str(s or "").strip().lower()
-
     # -------------------------
     # Header
     # -------------------------
@@ -382,12 +622,14 @@ class ChaosCatcherApp(tk.Tk):
         return _now_local().date().isoformat()
 
     def _refresh_all_lists(self) -> None:
-        self._refresh_med_list()
-        self._refresh_mood_list()
-        self._refresh_water_list()
-        self._draw_mood_graph()
-        self._refresh_vyvanse_chip()
-        self._refresh_water_today_chip()
+        # one snapshot for every view instead of a load per refresh
+        data = self.store.load()
+        self._refresh_med_list(data)
+        self._refresh_mood_list(data)
+        self._refresh_water_list(data)
+        self._schedule_graph_redraw()
+        self._refresh_vyvanse_chip(data)
+        self._refresh_water_today_chip(data)
 
     def _write_stats(self, text: str) -> None:
         if not hasattr(self, "stats_out"):
@@ -467,17 +709,15 @@ class ChaosCatcherApp(tk.Tk):
         if notes:
             entry["notes"] = notes
 
-        data = self.store.load()
-        data.setdefault("medications", []).append(entry)
-        self.store.save(data)
+        data = self.store.append("medications", entry)
 
         self.med_name.set("")
         self.med_dose.set("")
         self.med_time.set("")
         self.med_notes.set("")
 
-        self._refresh_med_list()
-        self._refresh_vyvanse_chip()
+        self._refresh_med_list(data)
+        self._refresh_vyvanse_chip(data)
 
     def _med_take_all(self) -> None:
         data = self.store.load()
@@ -492,29 +732,29 @@ class ChaosCatcherApp(tk.Tk):
             return
 
         ts = _now_local().isoformat(timespec="seconds")
-        meds = data.setdefault("medications", [])
 
         added = 0
-        for item in template:
-            if not isinstance(item, dict):
-                continue
-            name = str(item.get("name", "")).strip()
-            dose = str(item.get("dose", "")).strip()
-            notes = str(item.get("notes", "")).strip()
+        with self.store.mutate() as data:
+            meds = data.setdefault("medications", [])
+            for item in template:
+                if not isinstance(item, dict):
+                    continue
+                name = str(item.get("name", "")).strip()
+                dose = str(item.get("dose", "")).strip()
+                notes = str(item.get("notes", "")).strip()
 
-            if not name or not dose:
-                continue
+                if not name or not dose:
+                    continue
 
-            entry: dict[str, Any] = {"ts": ts, "name": name, "dose": dose}
-            if notes:
-                entry["notes"] = notes
+                entry: dict[str, Any] = {"ts": ts, "name": name, "dose": dose}
+                if notes:
+                    entry["notes"] = notes
 
-            meds.append(entry)
-            added += 1
+                meds.append(entry)
+                added += 1
 
-        self.store.save(data)
-        self._refresh_med_list()
-        self._refresh_vyvanse_chip()
+        self._refresh_med_list(data)
+        self._refresh_vyvanse_chip(data)
         messagebox.showinfo("Logged", f"Added {added} meds at {_fmt_time(_now_local())}.")
 
     def _med_delete_selected(self) -> None:
@@ -526,56 +766,60 @@ class ChaosCatcherApp(tk.Tk):
 
         idx = sel[0]
         data = self.store.load()
-        meds = data.get("medications", [])
-        meds_sorted = sorted(meds, key=lambda m: str(m.get("ts", "")), reverse=True)
+        meds_sorted = self.store.sorted_desc("medications", data)
         if idx < 0 or idx >= len(meds_sorted):
             return
-        target = meds_sorted[idx]
-
-        for i, m in enumerate(meds):
-            if m == target:
-                meds.pop(i)
-                break
-
-        data["medications"] = meds
-        self.store.save(data)
-        self._refresh_med_list()
-        self._refresh_vyvanse_chip()
-
-    def _refresh_med_list(self) -> None:
-        self.med_list.delete(0, tk.END)
-        data = self.store.load()
-        meds = sorted(data.get("medications", []), key=lambda m: str(m.get("ts", "")), reverse=True)
-
-        for m in meds:
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
-            when = f"{dt.date().isoformat()} {_fmt_time(dt)}" if dt else str(m.get("ts", ""))
+        target = meds_sorted[idx]  # the same dict object as in the data list
+
+        with self.store.mutate() as data:
+            meds = data.get("medications", [])
+            for i, m in enumerate(meds):
+                if m is target:
+                    meds.pop(i)
+                    break
+            data["medications"] = meds
+        self._refresh_med_list(data)
+        self._refresh_vyvanse_chip(data)
+
+    def _refresh_med_list(self, data: dict[str, Any] | None = None) -> None:
+        if data is None:
+            data = self.store.load()
+        lines: list[str] = []
+        for m in self.store.sorted_desc("medications", data):
+            when = _ts_display(str(m.get("ts", "")))
             notes = m.get("notes", "")
             line = f"{when} — {m.get('name', '')} {m.get('dose', '')}"
             if notes:
                 line += f"  |  {notes}"
-            self.med_list.insert(tk.END, line)
+            lines.append(line)
+        self._set_list_rows(self.med_list, lines)
 
     # -------------------------
     # Vyvanse arc helpers
     # -------------------------
 
-    def _find_latest_vyvanse_entry(self):
-        data = self.store.load()
+    def _find_latest_vyvanse_entry(self, data: dict[str, Any] | None = None):
+        if data is None:
+            data = self.store.load()
         meds = data.get("medications", [])
         best_entry = None
         best_dt = None
+        floor = ""
 
+        # a raw ts below the leader's _ts_floor can't be later whatever its offset,
+        # so only entries that pass the string compare are name-checked and parsed
         for m in meds:
-            name = str(m.get("name", "")).strip().lower()
-            if ("vyvanse" not in name) and ("vyv" not in name):
+            ts = m.get("ts")
+            if not isinstance(ts, str) or ts < floor:
                 continue
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
-            if not dt:
+            if not _VY_RE.search(str(m.get("name", ""))):
                 continue
-            if best_dt is None or dt > best_dt:
-                best_dt = dt
-                best_entry = m
+            dt = _dt_from_entry_ts(ts)
+            if dt is None or (best_dt is not None and dt <= best_dt):
+                continue
+            best_dt = dt
+            best_entry = m
+            floor = _ts_floor(dt)
 
         return best_entry, best_dt
 
@@ -588,33 +832,14 @@ class ChaosCatcherApp(tk.Tk):
         return "50 mg"
 
     def _vyvanse_arc_phase(self, t_minutes: float) -> str:
-        if t_minutes < 0:
-            return "Not yet"
-        if t_minutes < 30:
-            return "Loading"
-        if t_minutes < 90:
-            return "Onset"
-        if t_minutes < 300:
-            return "Peak"
-        if t_minutes < 480:
-            return "Plateau"
-        if t_minutes < 660:
-            return "Taper"
-        return "Tail"
-
-    def _fmt_hm(self, minutes: int) -> str:
-        h = minutes // 60
-        m = minutes % 60
-        if h <= 0:
-            return f"{m}m"
-        return f"{h}h {m:02d}m"
+        return _VY_PHASE_LABELS[bisect_right(_VY_PHASE_BOUNDS, t_minutes)]
 
     def _build_vyvanse_chip_text(self, dose_dt: datetime):
         now = _now_local()
         delta = now - dose_dt
         t_min = delta.total_seconds() / 60.0
         phase = self._vyvanse_arc_phase(t_min)
-        t_pretty = self._fmt_hm(max(0, int(round(t_min))))
+        t_pretty = _fmt_hm(max(0, int(round(t_min))))
         chip = f"Vyvanse: {phase} (T+{t_pretty})"
         return chip, phase, t_min
 
@@ -627,28 +852,15 @@ class ChaosCatcherApp(tk.Tk):
         dose = (entry or {}).get("dose") or (entry or {}).get("amount") or ""
         notes = (entry or {}).get("notes") or ""
 
-        windows = [
-            ("Loading", (0, 30)),
-            ("Onset", (30, 90)),
-            ("Peak", (90, 300)),
-            ("Plateau", (300, 480)),
-            ("Taper", (480, 660)),
-            ("Tail", (660, None)),
-        ]
-
         lines: list[str] = []
         lines.append(f"Taken: {taken_str}")
         if dose:
             lines.append(f"Dose: {dose}")
         lines.append(f"Now: {_now_local().strftime('%I:%M %p').lstrip('0')}")
-        lines.append(f"Current: {phase} (T+{self._fmt_hm(max(0, int(round(t_min))))})")
+        lines.append(f"Current: {phase} (T+{_fmt_hm(max(0, int(round(t_min))))})")
         lines.append("")
         lines.append("Arc model:")
-        for label, (a, b) in windows:
-            if b is None:
-                lines.append(f"• {label}: {self._fmt_hm(a)}+")
-            else:
-                lines.append(f"• {label}: {self._fmt_hm(a)}–{self._fmt_hm(b)}")
+        lines.extend(_VY_ARC_LINES)
 
         if notes:
             lines.append("")
@@ -667,11 +879,11 @@ class ChaosCatcherApp(tk.Tk):
         details = self._vyvanse_details_text(entry, dt, phase, t_min)
         messagebox.showinfo("Vyvanse Arc", details)
 
-    def _refresh_vyvanse_chip(self) -> None:
+    def _refresh_vyvanse_chip(self, data: dict[str, Any] | None = None) -> None:
         if not hasattr(self, "vy_arc_label"):
             return
 
-        entry, dt = self._find_latest_vyvanse_entry()
+        entry, dt = self._find_latest_vyvanse_entry(data)
         if not entry or not dt:
             self.vy_arc_label.configure(text="Vyvanse: —")
             if hasattr(self, "vy_phase_bar"):
@@ -727,12 +939,10 @@ class ChaosCatcherApp(tk.Tk):
         if notes.strip():
             entry["notes"] = notes.strip()
 
-        data = self.store.load()
-        data.setdefault("medications", []).append(entry)
-        self.store.save(data)
+        data = self.store.append("medications", entry)
 
-        self._refresh_med_list()
-        self._refresh_vyvanse_chip()
+        self._refresh_med_list(data)
+        self._refresh_vyvanse_chip(data)
 
     # -------------------------
     # Mood tab
@@ -783,24 +993,7 @@ class ChaosCatcherApp(tk.Tk):
         ).pack(anchor="e")
 
     def _parse_tags(self, raw: str) -> list[str]:
-        raw = raw.strip()
-        if not raw:
-            return []
-        parts: list[str] = []
-        for chunk in raw.replace(",", " ").split():
-            c = chunk.strip()
-            if c:
-                parts.append(c)
-
-        out: list[str] = []
-        seen: set[str] = set()
-        for p in parts:
-            k = p.lower()
-            if k in seen:
-                continue
-            seen.add(k)
-            out.append(p)
-        return out
+        return _parse_tags(raw)
 
     def _mood_add(self) -> None:
         score = int(self.mood_score.get())
@@ -826,9 +1019,9 @@ class ChaosCatcherApp(tk.Tk):
             entry["notes"] = notes
 
         try:
-            st = _parse_minutes(self.sleep_total.get())
-            sr = _parse_minutes(self.sleep_rem.get())
-            sd = _parse_minutes(self.sleep_deep.get())
+            st = _parse_duration(self.sleep_total.get())
+            sr = _parse_duration(self.sleep_rem.get())
+            sd = _parse_duration(self.sleep_deep.get())
         except ValueError as e:
             messagebox.showerror("Bad sleep value", str(e))
             return
@@ -840,17 +1033,15 @@ class ChaosCatcherApp(tk.Tk):
         if sd is not None:
             entry["sleep_deep_min"] = sd
 
-        data = self.store.load()
-        data.setdefault("moods", []).append(entry)
-        self.store.save(data)
+        data = self.store.append("moods", entry)
 
         self.mood_tags.set("")
         self.mood_notes.set("")
         self.sleep_total.set("")
         self.sleep_rem.set("")
         self.sleep_deep.set("")
-        self._refresh_mood_list()
-        self._draw_mood_graph()
+        self._refresh_mood_list(data)
+        self._schedule_graph_redraw()
 
     def _mood_delete_selected(self) -> None:
         sel = self.mood_list.curselection()
@@ -861,30 +1052,29 @@ class ChaosCatcherApp(tk.Tk):
 
         idx = sel[0]
         data = self.store.load()
-        moods = data.get("moods", [])
-        moods_sorted = sorted(moods, key=lambda m: str(m.get("ts", "")), reverse=True)
+        moods_sorted = self.store.sorted_desc("moods", data)
         if idx < 0 or idx >= len(moods_sorted):
             return
         target = moods_sorted[idx]
 
-        for i, m in enumerate(moods):
-            if m == target:
-                moods.pop(i)
-                break
-
-        data["moods"] = moods
-        self.store.save(data)
-        self._refresh_mood_list()
-        self._draw_mood_graph()
-
-    def _refresh_mood_list(self) -> None:
-        self.mood_list.delete(0, tk.END)
-        data = self.store.load()
-        moods = sorted(data.get("moods", []), key=lambda m: str(m.get("ts", "")), reverse=True)
+        with self.store.mutate() as data:
+            moods = data.get("moods", [])
+            for i, m in enumerate(moods):
+                if m is target:
+                    moods.pop(i)
+                    break
+            data["moods"] = moods
+        self._refresh_mood_list(data)
+        self._schedule_graph_redraw()
+
+    def _refresh_mood_list(self, data: dict[str, Any] | None = None) -> None:
+        if data is None:
+            data = self.store.load()
+        moods = self.store.sorted_desc("moods", data)
 
+        lines: list[str] = []
         for m in moods:
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
-            when = f"{dt.date().isoformat()} {_fmt_time(dt)}" if dt else str(m.get("ts", ""))
+            when = _ts_display(str(m.get("ts", "")))
             tags = m.get("tags", [])
             notes = m.get("notes", "")
             st = m.get("sleep_total_min")
@@ -902,55 +1092,61 @@ class ChaosCatcherApp(tk.Tk):
                 )
             if notes:
                 line += f" | {notes}"
-            self.mood_list.insert(tk.END, line)
+            lines.append(line)
+        self._set_list_rows(self.mood_list, lines)
 
     # -------------------------
     # Water goals (global default + per-day override)
     # -------------------------
 
-    def _get_water_goal_for_day(self, day_key: str) -> int:
-        data = self.store.load()
+    def _get_water_goal_for_day(self, day_key: str, data: dict[str, Any] | None = None) -> int:
+        if data is None:
+            data = self.store.load()
         daily_logs = data.get("daily_logs", {})
         if isinstance(daily_logs, dict):
             d = daily_logs.get(day_key)
             if isinstance(d, dict):
-                g = d.get("water_goal_oz")
-                if isinstance(g, (int, float)):
-                    return int(g)
-                if isinstance(g, str) and g.strip().isdigit():
-                    return int(g.strip())
-
-        g2 = data.get("water_goal_oz", 80)
-        if isinstance(g2, (int, float)):
-            return int(g2)
-        if isinstance(g2, str) and g2.strip().isdigit():
-            return int(g2.strip())
-        return 80
+                g = _coerce_oz(d.get("water_goal_oz"))
+                if g is not None:  # a 0 override is kept: it means "no goal today"
+                    return g
+
+        g = _coerce_oz(data.get("water_goal_oz", 80))
+        return 80 if g is None else g
 
     def _set_water_goal_for_day(self, day_key: str, goal_oz: int) -> None:
-        data = self.store.load()
+        self._set_water_goals(goal_oz, day_key=day_key)
+
+    def _set_default_water_goal(self, goal_oz: int, day_key: str | None = None) -> None:
+        """Set the default goal; with day_key, that day's override too, in the same save."""
+        self._set_water_goals(goal_oz, day_key=day_key, default=True)
+
+    def _set_water_goals(self, goal_oz: int, day_key: str | None = None, default: bool = False) -> None:
         if goal_oz < 0 or goal_oz > 512:
             raise ValueError("Goal must be a reasonable oz amount (0–512).")
 
-        logs = data.setdefault("daily_logs", {})
-        if not isinstance(logs, dict):
-            logs = {}
-            data["daily_logs"] = logs
+        # re-submitting the stored goals changes nothing: skip the file rewrite
+        data = self.store.load()
+        day_obj = data["daily_logs"].get(day_key) if day_key is not None else None
+        if (not default or _same_int(data.get("water_goal_oz"), goal_oz)) and (
+            day_key is None or (isinstance(day_obj, dict) and _same_int(day_obj.get("water_goal_oz"), goal_oz))
+        ):
+            return
 
-        day_obj = logs.get(day_key)
-        if not isinstance(day_obj, dict):
-            day_obj = {}
-            logs[day_key] = day_obj
+        with self.store.mutate() as data:
+            if default:
+                data["water_goal_oz"] = int(goal_oz)
+            if day_key is not None:
+                logs = data.setdefault("daily_logs", {})
+                if not isinstance(logs, dict):
+                    logs = {}
+                    data["daily_logs"] = logs
 
-        day_obj["water_goal_oz"] = int(goal_oz)
-        self.store.save(data)
+                day_obj = logs.get(day_key)
+                if not isinstance(day_obj, dict):
+                    day_obj = {}
+                    logs[day_key] = day_obj
 
-    def _set_default_water_goal(self, goal_oz: int) -> None:
-        data = self.store.load()
-        if goal_oz < 0 or goal_oz > 512:
-            raise ValueError("Goal must be a reasonable oz amount (0–512).")
-        data["water_goal_oz"] = int(goal_oz)
-        self.store.save(data)
+                day_obj["water_goal_oz"] = int(goal_oz)
 
     # -------------------------
     # Water tab
@@ -1061,9 +1257,8 @@ class ChaosCatcherApp(tk.Tk):
             messagebox.showerror("Bad goal", "Please enter a reasonable goal (0–512 oz).")
             return
 
-        self._set_default_water_goal(goal)
         # also set today's override to match (so the chip updates consistently)
-        self._set_water_goal_for_day(self._today_key(), goal)
+        self._set_default_water_goal(goal, day_key=self._today_key())
         self._refresh_water_today_chip()
 
     def _water_quick_add(self, oz: int) -> None:
@@ -1071,11 +1266,8 @@ class ChaosCatcherApp(tk.Tk):
             "ts": _now_local().isoformat(timespec="seconds"),
             "oz": int(oz),
         }
-        data = self.store.load()
-        data.setdefault("water", []).append(entry)
-        self.store.save(data)
-        self._refresh_water_list()
-        self._refresh_water_today_chip()
+        data = self._water_append(entry)
+        self._refresh_water_today_chip(data)
 
     def _water_add(self) -> None:
         raw_oz = self.water_oz.get().strip()
@@ -1099,29 +1291,35 @@ class ChaosCatcherApp(tk.Tk):
 
         entry: dict[str, Any] = {"ts": ts, "oz": oz}
 
-        data = self.store.load()
-        data.setdefault("water", []).append(entry)
-        self.store.save(data)
+        data = self._water_append(entry)
 
         self.water_oz.set("8")
         self.water_time.set("")
 
-        self._refresh_water_list()
-        self._refresh_water_today_chip()
+        self._refresh_water_today_chip(data)
 
-    def _refresh_water_list(self) -> None:
+    def _refresh_water_list(self, data: dict[str, Any] | None = None) -> None:
         if not hasattr(self, "water_list"):
             return
 
-        self.water_list.delete(0, tk.END)
-        data = self.store.load()
-        water = sorted(data.get("water", []), key=lambda w: str(w.get("ts", "")), reverse=True)
+        if data is None:
+            data = self.store.load()
+        self._set_list_rows(self.water_list, [_water_row(w) for w in self.store.sorted_desc("water", data)])
+        self._water_list_data = data
 
-        for w in water:
-            dt = _dt_from_entry_ts(str(w.get("ts", "")))
-            when = f"{dt.date().isoformat()} {_fmt_time(dt)}" if dt else str(w.get("ts", ""))
-            oz = w.get("oz", "")
-            self.water_list.insert(tk.END, f"{when} — {oz} oz")
+    def _water_append(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Store.append() one water entry and patch its row into the list rather than rebuilding it."""
+        data = self.store.load()
+        row = _desc_insert_pos(self.store.sorted_desc("water", data), entry)
+        saved = self.store.append("water", entry)
+        rows = self._list_rows.get(self.water_list) if hasattr(self, "water_list") else None
+        if saved is data and self._water_list_data is data and rows is not None:
+            line = _water_row(entry)
+            rows.insert(row, line)
+            self.water_list.insert(row, line)
+        else:
+            self._refresh_water_list(saved)
+        return saved
 
     def _water_delete_selected(self) -> None:
         if not hasattr(self, "water_list"):
@@ -1134,75 +1332,42 @@ class ChaosCatcherApp(tk.Tk):
 
         idx = sel[0]
         data = self.store.load()
-        water = data.get("water", [])
-        water_sorted = sorted(water, key=lambda w: str(w.get("ts", "")), reverse=True)
+        water_sorted = self.store.sorted_desc("water", data)
         if idx < 0 or idx >= len(water_sorted):
             return
         target = water_sorted[idx]
 
-        for i, w in enumerate(water):
-            if w == target:
-                water.pop(i)
-                break
-
-        data["water"] = water
-        self.store.save(data)
-        self._refresh_water_list()
-        self._refresh_water_today_chip()
-
-    def _water_total_today_oz(self) -> int:
-        data = self.store.load()
-        water = data.get("water", [])
-        today = _now_local().date()
-        total = 0
-
-        for w in water:
-            dt = _dt_from_entry_ts(str(w.get("ts", "")))
-            if not dt:
-                continue
-            if dt.astimezone().date() == today:
-                oz = w.get("oz")
-                if isinstance(oz, (int, float)):
-                    total += int(oz)
-                elif isinstance(oz, str) and oz.strip().isdigit():
-                    total += int(oz.strip())
-
-        return total
-
-    def _water_daily_totals(self, days: int) -> dict[str, int]:
-        cutoff = _now_local().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days - 1)
-
-        data = self.store.load()
-        water = data.get("water", [])
-
-        by_day: dict[str, int] = {}
-
-        for w in water:
-            dt = _dt_from_entry_ts(str(w.get("ts", "")))
-            if not dt or dt < cutoff:
-                continue
-
-            oz = w.get("oz")
-            n = 0
-            if isinstance(oz, (int, float)):
-                n = int(oz)
-            elif isinstance(oz, str) and oz.strip().isdigit():
-                n = int(oz.strip())
-
-            if n <= 0:
-                continue
+        with self.store.mutate() as data:
+            water = data.get("water", [])
+            for i, w in enumerate(water):
+                if w is target:
+                    water.pop(i)
+                    break
+            data["water"] = water
+        rows = self._list_rows.get(self.water_list)
+        if self._water_list_data is data and rows is not None and idx < len(rows):
+            del rows[idx]
+            self.water_list.delete(idx)
+        else:
+            self._refresh_water_list(data)
+        self._refresh_water_today_chip(data)
 
-            day = dt.date().isoformat()
-            by_day[day] = by_day.get(day, 0) + n
+    def _water_total_today_oz(self, data: dict[str, Any] | None = None) -> int:
+        # every numeric amount, as this chip always has; the daily totals skip non-positive ones
+        return self.store.day_totals("water", "oz", data, positive=False).get(_now_local().date().isoformat(), 0)
 
-        return by_day
+    def _water_daily_totals(self, days: int, data: dict[str, Any] | None = None) -> dict[str, int]:
+        first = (_now_local().date() - timedelta(days=days - 1)).isoformat()
+        return {d: n for d, n in self.store.day_totals("water", "oz", data).items() if d >= first}
 
-    def _refresh_water_today_chip(self) -> None:
+    def _refresh_water_today_chip(self, data: dict[str, Any] | None = None) -> None:
         if not hasattr(self, "water_today_chip"):
             return
 
-        total = self._water_total_today_oz()
-        goal = self._get_water_goal_for_day(self._today_key())
+        if data is None:
+            data = self.store.load()
+        total = self._water_total_today_oz(data)
+        goal = self._get_water_goal_for_day(self._today_key(), data)
 
         if goal > 0:
             pct = int(round((total / goal) * 100)) if goal else 0
@@ -1266,6 +1431,8 @@ class ChaosCatcherApp(tk.Tk):
         )
         self.graph_canvas.pack(fill="x", padx=6, pady=(0, 6))
         self.graph_canvas.bind("<Configure>", self._schedule_graph_redraw)
+        self.graph_canvas.bind("<Motion>", self._graph_motion)
+        self.graph_canvas.bind("<Leave>", self._graph_leave)
 
         analysis_box = ttk.LabelFrame(self.tab_stats, text="Mood Analysis")
         analysis_box.pack(fill="x", padx=4, pady=6)
@@ -1300,31 +1467,9 @@ class ChaosCatcherApp(tk.Tk):
 
     def _stats_water_totals(self) -> None:
         days = int(self.stats_days.get())
-        cutoff = _now_local().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days - 1)
-
         data = self.store.load()
-        water = data.get("water", [])
-
-        by_day: dict[str, int] = {}
-        total = 0
-
-        for w in water:
-            dt = _dt_from_entry_ts(str(w.get("ts", "")))
-            if not dt or dt < cutoff:
-                continue
-
-            oz = w.get("oz")
-            n = 0
-            if isinstance(oz, (int, float)):
-                n = int(oz)
-            elif isinstance(oz, str) and oz.strip().isdigit():
-                n = int(oz.strip())
-            if n <= 0:
-                continue
-
-            day = dt.date().isoformat()
-            by_day[day] = by_day.get(day, 0) + n
-            total += n
+        by_day = self._water_daily_totals(days, data)
+        total = sum(by_day.values())
 
         lines = [
             f"Water totals (last {days} days)",
@@ -1338,7 +1483,7 @@ class ChaosCatcherApp(tk.Tk):
         else:
             # include goal if available for that day
             for d in sorted(by_day.keys()):
-                goal = self._get_water_goal_for_day(d)
+                goal = self._get_water_goal_for_day(d, data)
                 if goal > 0:
                     pct = int(round((by_day[d] / goal) * 100))
                     lines.append(f"- {d}: {by_day[d]} / {goal} oz ({pct}%)")
@@ -1355,8 +1500,12 @@ class ChaosCatcherApp(tk.Tk):
         meds = data.get("medications", [])
 
         counts: dict[str, int] = {}
+        floor = _ts_floor(cutoff)
         for m in meds:
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
+            ts = m.get("ts")
+            if not isinstance(ts, str) or ts < floor:
+                continue
+            dt = _dt_from_entry_ts(ts)
             if not dt or dt < cutoff:
                 continue
             name = str(m.get("name", "")).strip()
@@ -1377,27 +1526,38 @@ class ChaosCatcherApp(tk.Tk):
 
         self._write_stats("\n".join(lines))
 
-    def _mood_daily_avgs(self, days: int) -> tuple[list[str], list[float]]:
+    def _mood_daily_avgs(self, days: int, data: dict[str, Any] | None = None) -> tuple[list[str], list[float]]:
         cutoff = _now_local().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days - 1)
-        data = self.store.load()
-        moods = data.get("moods", [])
+        if data is None:
+            data = self.store.load()
+        ts_col, score_col = self.store.scored_moods(data)
 
+        # day -> [score sum, count]: running totals instead of per-day score lists
         by_day: dict[str, list[int]] = {}
-        for m in moods:
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
+        by_day_get = by_day.get
+        floor = _ts_floor(cutoff)
+        for ts, s in zip(ts_col, score_col):
+            if ts < floor:
+                continue
+            dt = _dt_from_entry_ts(ts)
             if not dt or dt < cutoff:
                 continue
-            s = m.get("score")
-            if isinstance(s, int) and 1 <= s <= 10:
-                by_day.setdefault(dt.date().isoformat(), []).append(s)
+            day = dt.date().isoformat()
+            acc = by_day_get(day)
+            if acc is None:
+                by_day[day] = [s, 1]
+            else:
+                acc[0] += s
+                acc[1] += 1
 
-        days_sorted = sorted(by_day.keys())
-        avgs = [sum(by_day[d]) / len(by_day[d]) for d in days_sorted]
+        days_sorted = sorted(by_day)
+        avgs = [by_day[d][0] / by_day[d][1] for d in days_sorted]
         return days_sorted, avgs
 
-    def _analyze_water_vs_mood(self, days: int = 30) -> str:
-        water_by_day = self._water_daily_totals(days)
-        mood_days, mood_avgs = self._mood_daily_avgs(days)
+    @_memo_per_day
+    def _analyze_water_vs_mood(self, days: int = 30, data: dict[str, Any] | None = None) -> str:
+        water_by_day = self._water_daily_totals(days, data)
+        mood_days, mood_avgs = self._mood_daily_avgs(days, data)
 
         xs: list[float] = []
         ys: list[float] = []
@@ -1442,44 +1602,49 @@ class ChaosCatcherApp(tk.Tk):
 
         self._write_stats("\n".join(lines))
 
-    def _daily_mood_series(self, days: int | None = 90) -> list[tuple[datetime, float]]:
-        data = self.store.load()
-        moods = data.get("moods", [])
+    def _daily_mood_series(
+        self, days: int | None = 90, data: dict[str, Any] | None = None
+    ) -> list[tuple[datetime, float]]:
+        if data is None:
+            data = self.store.load()
+        ts_col, score_col = self.store.scored_moods(data)
 
         cutoff = None
         if days is not None:
             cutoff = _now_local().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days - 1)
 
+        # day -> [score sum, count]
         by_day: dict[datetime, list[int]] = {}
-        for m in moods:
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
+        by_day_get = by_day.get
+        floor = _ts_floor(cutoff)
+        for ts, s in zip(ts_col, score_col):
+            if ts < floor:
+                continue
+            dt = _dt_from_entry_ts(ts)
             if not dt:
                 continue
-            day = dt.astimezone().replace(hour=0, minute=0, second=0, microsecond=0)
+            day = dt.replace(hour=0, minute=0, second=0, microsecond=0)  # already local: _dt_from_entry_ts converts
             if cutoff and day < cutoff:
                 continue
-            s = m.get("score")
-            if isinstance(s, int) and 1 <= s <= 10:
-                by_day.setdefault(day, []).append(s)
-
-        out: list[tuple[datetime, float]] = []
-        for day in sorted(by_day.keys()):
-            vals = by_day[day]
-            out.append((day, sum(vals) / len(vals)))
-        return out
+            acc = by_day_get(day)
+            if acc is None:
+                by_day[day] = [s, 1]
+            else:
+                acc[0] += s
+                acc[1] += 1
+
+        return [(day, by_day[day][0] / by_day[day][1]) for day in sorted(by_day)]
 
     def _rolling_avg(self, values: list[float], window: int) -> list[float | None]:
         if window <= 0:
             raise ValueError("window must be > 0")
-        out: list[float | None] = [None] * len(values)
         if len(values) < window:
-            return out
+            return [None] * len(values)
 
-        running = sum(values[:window])
-        out[window - 1] = running / window
-        for i in range(window, len(values)):
-            running += values[i] - values[i - window]
-            out[i] = running / window
+        # running window sums: each step adds values[i] - values[i - window], folded in C
+        sums = accumulate(map(sub, values[window:], values), initial=sum(values[:window]))
+        out: list[float | None] = [None] * (window - 1)
+        out.extend([r / window for r in sums])
         return out
 
     def _compute_baseline(
@@ -1505,6 +1670,7 @@ class ChaosCatcherApp(tk.Tk):
             return None
         return sum(vals) / len(vals)
 
+    @_memo_per_day
     def _detect_mood_alerts(
         self,
         lookback_days: int = 90,
@@ -1515,8 +1681,9 @@ class ChaosCatcherApp(tk.Tk):
         crash_drop_3day: float = 1.5,
         low_zone: float = 4.0,
         high_zone: float = 7.0,
+        data: dict[str, Any] | None = None,
     ) -> str:
-        series = self._daily_mood_series(days=lookback_days)
+        series = self._daily_mood_series(days=lookback_days, data=data)
         if len(series) < 5:
             return "Not enough mood data yet for alerts (need a few days of entries)."
 
@@ -1526,25 +1693,54 @@ class ChaosCatcherApp(tk.Tk):
         baseline = self._compute_baseline(series, baseline_days=baseline_days, exclude_recent_days=exclude_recent_days)
         r3 = self._rolling_avg(vals, 3)
 
+        date_iso = [d.date().isoformat() for d in days]
+        n = len(vals)
+        dip_floor = baseline - dip_threshold if baseline is not None else None
+
+        # One pass over the series; each pattern keeps its own hit list so the
+        # report order (day drops, 3-day drops, low streaks) is unchanged.
+        dip_events: list[tuple[int, float]] = []
+        day_hits: list[str] = []
+        avg_hits: list[str] = []
+        streak_hits: list[str] = []
+        for i in range(n):
+            v = vals[i]
+            avg3 = r3[i]
+            if dip_floor is not None and avg3 is not None and avg3 <= dip_floor:
+                dip_events.append((i, avg3))
+            if i >= 1:
+                drop = vals[i - 1] - v
+                if drop >= crash_drop_day:
+                    day_hits.append(
+                        f"- Day-to-day drop ≥ {crash_drop_day:.1f}: {date_iso[i - 1]} ({vals[i - 1]:.1f}) → "
+                        f"{date_iso[i]} ({v:.1f}) [drop {drop:.1f}]"
+                    )
+            if i >= 5:
+                a_prev = r3[i - 3]
+                if avg3 is not None and a_prev is not None:
+                    drop = a_prev - avg3
+                    if drop >= crash_drop_3day:
+                        avg_hits.append(
+                            f"- 3-day avg drop ≥ {crash_drop_3day:.1f}: {date_iso[i - 3]} (avg {a_prev:.2f}) → "
+                            f"{date_iso[i]} (avg {avg3:.2f}) [drop {drop:.2f}]"
+                        )
+            if i < n - 2 and v >= high_zone and vals[i + 1] <= low_zone and vals[i + 2] <= low_zone:
+                streak_hits.append(
+                    f"- Low streak after high day: {date_iso[i]} ({v:.1f}) then "
+                    f"{date_iso[i + 1]} ({vals[i + 1]:.1f}), "
+                    f"{date_iso[i + 2]} ({vals[i + 2]:.1f})"
+                )
+
         alerts: list[str] = []
 
         if baseline is not None:
-            dip_events: list[tuple[datetime, float]] = []
-            for i in range(len(vals)):
-                avg3 = r3[i]
-                if avg3 is None:
-                    continue
-                if avg3 <= baseline - dip_threshold:
-                    dip_events.append((days[i], avg3))
-
             if dip_events:
-                last_day, last_avg3 = dip_events[-1]
-                ongoing = days[-1] == last_day
-                status = "ONGOING" if ongoing else "RECENT"
+                last_i, last_avg3 = dip_events[-1]
+                status = "ONGOING" if last_i == n - 1 else "RECENT"
                 alerts.append(
                     f"⚠️  3-day dip vs baseline ({status})\n"
                     f"- Baseline (approx): {baseline:.2f}/10\n"
-                    f"- Latest 3-day avg:  {last_avg3:.2f}/10 on {last_day.date().isoformat()}\n"
+                    f"- Latest 3-day avg:  {last_avg3:.2f}/10 on {date_iso[last_i]}\n"
                     f"- Drop: {baseline - last_avg3:.2f} (threshold {dip_threshold:.2f})"
                 )
             else:
@@ -1556,35 +1752,7 @@ class ChaosCatcherApp(tk.Tk):
         else:
             alerts.append("Baseline unavailable (not enough prior days).")
 
-        crash_hits: list[str] = []
-
-        for i in range(1, len(vals)):
-            drop = vals[i - 1] - vals[i]
-            if drop >= crash_drop_day:
-                crash_hits.append(
-                    f"- Day-to-day drop ≥ {crash_drop_day:.1f}: {days[i - 1].date().isoformat()} ({vals[i - 1]:.1f}) → "
-                    f"{days[i].date().isoformat()} ({vals[i]:.1f}) [drop {drop:.1f}]"
-                )
-
-        for i in range(5, len(vals)):
-            a_now = r3[i]
-            a_prev = r3[i - 3]
-            if a_now is None or a_prev is None:
-                continue
-            drop = a_prev - a_now
-            if drop >= crash_drop_3day:
-                crash_hits.append(
-                    f"- 3-day avg drop ≥ {crash_drop_3day:.1f}: {days[i - 3].date().isoformat()} (avg {a_prev:.2f}) → "
-                    f"{days[i].date().isoformat()} (avg {a_now:.2f}) [drop {drop:.2f}]"
-                )
-
-        for i in range(len(vals) - 2):
-            if vals[i] >= high_zone and vals[i + 1] <= low_zone and vals[i + 2] <= low_zone:
-                crash_hits.append(
-                    f"- Low streak after high day: {days[i].date().isoformat()} ({vals[i]:.1f}) then "
-                    f"{days[i + 1].date().isoformat()} ({vals[i + 1]:.1f}), "
-                    f"{days[i + 2].date().isoformat()} ({vals[i + 2]:.1f})"
-                )
+        crash_hits = day_hits + avg_hits + streak_hits
 
         if crash_hits:
             crash_block = "💥 Emotional crash patterns detected\n" + "\n".join(crash_hits[-6:])
@@ -1602,26 +1770,33 @@ class ChaosCatcherApp(tk.Tk):
 
         return "Mood Alerts\n----------------------------\n" + "\n\n".join(alerts) + guidance
 
-    def _analyze_sleep_vs_mood(self, days: int = 30) -> str:
-        data = self.store.load()
+    def _analyze_sleep_vs_mood(self, days: int = 30, data: dict[str, Any] | None = None) -> str:
+        if data is None:
+            data = self.store.load()
         moods = data.get("moods", [])
         cutoff = _now_local() - timedelta(days=days)
 
         sleep_vals: list[float] = []
         mood_vals: list[float] = []
 
+        floor = _ts_floor(cutoff)
         for m in moods:
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
+            ts = m.get("ts")
+            if not isinstance(ts, str) or ts < floor:
+                continue
+            dt = _dt_from_entry_ts(ts)
             if not dt or dt < cutoff:
                 continue
             score = m.get("score")
             sleep_total = m.get("sleep_total_min")
             if isinstance(score, int) and sleep_total is not None:
                 try:
-                    mood_vals.append(float(score))
-                    sleep_vals.append(float(sleep_total))
+                    sleep = float(sleep_total)
                 except Exception:
                     continue
+                # both lists grow together, so _pearson_corr pairs each sleep with its own mood
+                sleep_vals.append(sleep)
+                mood_vals.append(float(score))
 
         if len(mood_vals) < 3:
             return "Not enough data yet to analyze sleep vs mood."
@@ -1651,22 +1826,22 @@ class ChaosCatcherApp(tk.Tk):
                 days = 30
 
         data = self.store.load()
-        moods = data.get("moods", [])
 
         cutoff = None
         if days is not None:
             cutoff = _now_local() - timedelta(days=days)
 
         scores: list[int] = []
-        for m in moods:
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
+        floor = _ts_floor(cutoff)
+        for ts, s in zip(*self.store.scored_moods(data)):
+            if ts < floor:
+                continue
+            dt = _dt_from_entry_ts(ts)
             if not dt:
                 continue
             if cutoff is not None and dt < cutoff:
                 continue
-            s = m.get("score")
-            if isinstance(s, int) and 1 <= s <= 10:
-                scores.append(s)
+            scores.append(s)
 
         if not scores:
             self._analysis_write("Mood Analysis\n----------------------------\nNo mood entries in this range.")
@@ -1676,18 +1851,16 @@ class ChaosCatcherApp(tk.Tk):
         mn = min(scores)
         mx = max(scores)
 
-        series = self._daily_mood_series(days=days if days is not None else 3650)
+        series = self._daily_mood_series(days=days if days is not None else 3650, data=data)
         if len(series) >= 3:
-            vals = [v for _, v in series]
-            xs = [float(i) for i in range(len(vals))]
-            slope = _linear_regression_slope(xs, [float(v) for v in vals])
+            slope = _daily_slope([v for _, v in series])
             trend_label = _trend_label_from_slope(slope, stable_band=0.02)
             trend_line = f"Trend: {trend_label} ({slope:+.2f}/day)\n"
         else:
             trend_line = "Trend: Not enough data for trend.\n"
 
-        sleep_insight = self._analyze_sleep_vs_mood(days=30)
-        water_insight = self._analyze_water_vs_mood(days if days is not None else 30)
+        sleep_insight = self._analyze_sleep_vs_mood(days=30, data=data)
+        water_insight = self._analyze_water_vs_mood(days if days is not None else 30, data=data)
 
         alerts_text = self._detect_mood_alerts(
             lookback_days=90,
@@ -1698,6 +1871,7 @@ class ChaosCatcherApp(tk.Tk):
             crash_drop_3day=1.5,
             low_zone=4.0,
             high_zone=7.0,
+            data=data,
         )
 
         base_text = (
@@ -1719,6 +1893,7 @@ class ChaosCatcherApp(tk.Tk):
     # -------------------------
 
     def _schedule_graph_redraw(self, _evt=None) -> None:
+        # Debounced: resizes and back-to-back mood saves collapse into one redraw.
         if self._graph_redraw_job is not None:
             try:
                 self.after_cancel(self._graph_redraw_job)
@@ -1780,35 +1955,83 @@ class ChaosCatcherApp(tk.Tk):
                 pass
         self._graph_tooltip = None
 
-    def _draw_mood_graph(self) -> None:
+    def _graph_motion(self, event) -> None:
+        """Canvas-wide <Motion>: show the tooltip of the dot under the pointer, only when that dot changes."""
+        xs = self._graph_xs
+        r = _GRAPH_HIT_RADIUS
+        hit = None
+        best = r * r
+        i = bisect_left(xs, event.x - r)
+        while i < len(xs) and xs[i] <= event.x + r:
+            dx = xs[i] - event.x
+            dy = self._graph_points[i][1] - event.y
+            d = dx * dx + dy * dy
+            if d <= best:
+                best, hit = d, i
+            i += 1
+
+        if hit == self._graph_hover:
+            return
+        self._graph_hover = hit
+        if hit is None:
+            self._graph_hide_tooltip()
+            return
+        day, v, count, vmin_day, vmax_day = self._graph_points[hit][2]
+        self._graph_show_tooltip(event, f"{day}\nAvg: {v:.2f}/10\nEntries: {count}\nMin/Max: {vmin_day}/{vmax_day}")
+
+    def _graph_leave(self, _event=None) -> None:
+        self._graph_hover = None
+        self._graph_hide_tooltip()
+
+    def _draw_mood_graph(self, data: dict[str, Any] | None = None) -> None:
+        if self._graph_redraw_job is not None:
+            # drawing now (e.g. the Draw button): a pending debounced redraw would only repeat it
+            try:
+                self.after_cancel(self._graph_redraw_job)
+            except Exception:
+                pass
+            self._graph_redraw_job = None
         if not hasattr(self, "graph_canvas") or not hasattr(self, "graph_days"):
             return
 
         days = int(self.graph_days.get())
         canvas = self.graph_canvas
         canvas.delete("all")
+        self._graph_points = []
+        self._graph_xs = []
+        if self._graph_hover is not None:
+            self._graph_leave()
 
-        data = self.store.load()
-        moods = data.get("moods", [])
+        if data is None:
+            data = self.store.load()
 
         cutoff = _now_local().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=days - 1)
 
+        # day -> [score sum, count, min, max], accumulated in the one pass
         by_day: dict[str, list[int]] = {}
-        for m in moods:
-            dt = _dt_from_entry_ts(str(m.get("ts", "")))
+        by_day_get = by_day.get
+        floor = _ts_floor(cutoff)
+        for ts, score in zip(*self.store.scored_moods(data)):
+            if ts < floor:
+                continue
+            dt = _dt_from_entry_ts(ts)
             if not dt or dt < cutoff:
                 continue
-            score = m.get("score")
-            if isinstance(score, int) and 1 <= score <= 10:
-                by_day.setdefault(dt.date().isoformat(), []).append(score)
-
-        days_sorted = sorted(by_day.keys())
-        daily_avgs: list[tuple[str, float, int, int, int]] = []
-        for d in days_sorted:
-            vals = by_day[d]
-            if vals:
-                avg = sum(vals) / len(vals)
-                daily_avgs.append((d, avg, len(vals), min(vals), max(vals)))
+            day = dt.date().isoformat()
+            acc = by_day_get(day)
+            if acc is None:
+                by_day[day] = [score, 1, score, score]
+            else:
+                acc[0] += score
+                acc[1] += 1
+                if score < acc[2]:
+                    acc[2] = score
+                elif score > acc[3]:
+                    acc[3] = score
+
+        daily_avgs: list[tuple[str, float, int, int, int]] = [
+            (d, acc[0] / acc[1], acc[1], acc[2], acc[3]) for d, acc in sorted(by_day.items())
+        ]
 
         w = max(1, canvas.winfo_width())
         h = max(1, canvas.winfo_height())
@@ -1822,8 +2045,7 @@ class ChaosCatcherApp(tk.Tk):
             return
 
         values = [avg for _, avg, _, _, _ in daily_avgs]
-        xs = list(range(len(values)))
-        slope = _linear_regression_slope([float(x) for x in xs], [float(y) for y in values])
+        slope = _daily_slope(values)
         trend_label = _trend_label_from_slope(slope, stable_band=0.02)
 
         vmin, vmax = 1.0, 10.0
@@ -1873,10 +2095,13 @@ class ChaosCatcherApp(tk.Tk):
                 pts.extend([x_for(i), y_for(v)])
             canvas.create_line(*pts, fill="#333", width=2)
 
-        for i, (day, v, count, vmin_day, vmax_day) in enumerate(daily_avgs):
+        # no per-dot bindings: _graph_motion hit-tests these points for the tooltips
+        points = self._graph_points
+        for i, row in enumerate(daily_avgs):
+            v = row[1]
             x, y = x_for(i), y_for(v)
 
-            dot = canvas.create_oval(
+            canvas.create_oval(
                 x - 3,
                 y - 3,
                 x + 3,
@@ -1884,11 +2109,8 @@ class ChaosCatcherApp(tk.Tk):
                 outline="",
                 fill=zone_color(v),
             )
-
-            tooltip_text = f"{day}\nAvg: {v:.2f}/10\nEntries: {count}\nMin/Max: {vmin_day}/{vmax_day}"
-
-            canvas.tag_bind(dot, "<Enter>", lambda e, t=tooltip_text: self._graph_show_tooltip(e, t))
-            canvas.tag_bind(dot, "<Leave>", self._graph_hide_tooltip)
+            points.append((x, y, row))
+        self._graph_xs = [p[0] for p in points]
 
         first_day = daily_avgs[0][0]
         last_day = daily_avgs[-1][0]
@@ -2261,29 +2483,22 @@ class ChaosCatcherApp(tk.Tk):
             "duration_min": duration_min,
             "completed": completed,
         }
-        data = self.store.load()
-        data.setdefault("focus_sessions", []).append(entry)
-        self.store.save(data)
+        self.store.append("focus_sessions", entry)
 
     # --- Session list ---
 
     def _refresh_focus_list(self) -> None:
         if not hasattr(self, "focus_list"):
             return
-        self.focus_list.delete(0, tk.END)
-        data = self.store.load()
-        sessions = sorted(
-            data.get("focus_sessions", []),
-            key=lambda s: str(s.get("ts", "")),
-            reverse=True,
-        )
+        sessions = self.store.sorted_desc("focus_sessions")
+        lines: list[str] = []
         for s in sessions:
-            dt = _dt_from_entry_ts(str(s.get("ts", "")))
-            when = f"{dt.date().isoformat()} {_fmt_time(dt)}" if dt else str(s.get("ts", ""))
+            when = _ts_display(str(s.get("ts", "")))
             task = str(s.get("task", "")).strip() or "—"
             dur = s.get("duration_min", 0)
             done = "✓" if s.get("completed") else "✗"
-            self.focus_list.insert(tk.END, f"{when}  {done} {dur}m — {task}")
+            lines.append(f"{when}  {done} {dur}m — {task}")
+        self._set_list_rows(self.focus_list, lines)
 
     # --- Export ---
 
@@ -2332,12 +2547,7 @@ class ChaosCatcherApp(tk.Tk):
             messagebox.showerror("Export failed", str(e))
 
     def _focus_export_json(self) -> None:
-        data = self.store.load()
-        sessions = sorted(
-            data.get("focus_sessions", []),
-            key=lambda s: str(s.get("ts", "")),
-            reverse=True,
-        )
+        sessions = self.store.sorted_desc("focus_sessions")
 
         default_name = f"focus-sessions-{_now_local().date().isoformat()}.json"
         path = filedialog.asksaveasfilename(
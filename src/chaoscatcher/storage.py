@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import glob
 import json
 import os
 import time
@@ -11,36 +12,252 @@ def _ensure_parent(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+# Appends rewrite the data file once the live journal grows past this (append_entry for
+# callers without a loaded dict, e.g. the CLI; Store.append in the GUI)
+_JOURNAL_COMPACT_BYTES = 1 << 20
+
+
+def _journal_path(path: Path) -> Path:
+    return path.with_name(path.name + ".journal")
+
+
+def _journal_files(path: Path) -> list[Path]:
+    """Journals set aside by earlier saves (oldest first), then the live one."""
+    live = _journal_path(path)
+    return [*sorted(path.parent.glob(glob.escape(live.name) + ".*")), live]
+
+
+# Every save appends {"folded": bytes, "ino": inode of the data file it writes} to each journal
+# before renaming that file into place. load_json skips a journal's first `folded` bytes per the
+# last mark naming the data file in place, so the fold state never enters the user's data: a save
+# that dies before its rename leaves the entries to be merged, and one that dies before removing
+# the journal can't merge them twice.
+_FOLD_PREFIX = b'{"folded": '
+
+# path -> (dict load_json last returned, data file stat key, {journal name: (inode, bytes merged, size read)}).
+# Tells save_json and append_entry exactly which journal lines that dict holds. In memory only.
+_MERGED: dict[Path, tuple[dict[str, Any], Any, dict[str, tuple[int, int, int]]]] = {}
+
+
 def load_json(path: Path) -> dict[str, Any]:
     """
     Safe load:
     - creates parent dirs
     - if missing/empty -> writes {}
     - if corrupt -> backs up raw text then resets to {}
+    - merges entries appended to the journal since the last save
     Always returns a dict.
     """
     path = Path(path)
+    data, stat_key, merged = _load(path)
+    _MERGED[path] = (data, stat_key, merged)
+    return data
+
+
+def _load(path: Path) -> tuple[dict[str, Any], Any, dict[str, tuple[int, int, int]]]:
     _ensure_parent(path)
+    data, st = _load_base(path)
+    if st is None:  # _load_base (re)wrote it: it holds no journal lines, whatever its inode
+        stat_key = _stat_key(path)
+        merged = _merge_journal(path, data, None)
+    else:
+        stat_key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        merged = _merge_journal(path, data, st.st_ino)
+    return data, stat_key, merged
 
-    if not path.exists():
+
+def _load_base(path: Path) -> tuple[dict[str, Any], os.stat_result | None]:
+    """The data file's dict and the stat of the file it was read from (None if it was just written)."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            st = os.fstat(f.fileno())
+            txt = f.read()
+    except FileNotFoundError:
         # create a minimal valid file
-        save_json(path, {})
-        return {}
+        _write_json(path, {})
+        return {}, None
 
-    txt = path.read_text(encoding="utf-8").strip()
-    if not txt:
-        save_json(path, {})
-        return {}
+    # json.loads already skips surrounding whitespace; avoid copying the whole file via strip()
+    if not txt or txt.isspace():
+        _write_json(path, {})
+        return {}, None
 
     try:
         data = json.loads(txt)
-        return data if isinstance(data, dict) else {}
+        return (data if isinstance(data, dict) else {}), st
     except json.JSONDecodeError:
         # corruption guard: backup then reset
         backup = path.with_suffix(f".corrupt-{int(time.time())}.json")
         backup.write_text(txt, encoding="utf-8")
-        save_json(path, {})
-        return {}
+        _write_json(path, {})
+        return {}, None
+
+
+# path -> ((data file stat key, journal stat key), parsed data); see load_json_readonly
+_READ_CACHE: dict[Path, tuple[tuple[Any, Any], dict[str, Any]]] = {}
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def stat_fingerprint(path: Path) -> tuple[Any, Any]:
+    """(data file, journal) (inode, mtime_ns, size); changes whenever load_json's result could."""
+    path = Path(path)
+    return (_stat_key(path), _stat_key(_journal_path(path)))
+
+
+def load_json_readonly(path: Path) -> dict[str, Any]:
+    """
+    load_json for callers that never mutate the result:
+    - memoized per path, keyed by the data file's and journal's (inode, mtime_ns, size)
+    - any save, append or outside edit changes the key, so the next call re-reads
+    The returned dict is shared between calls; mutate-and-save callers use load_json.
+    """
+    path = Path(path)
+    # stat before reading: a write racing the read just causes a miss next time
+    key = stat_fingerprint(path)
+    hit = _READ_CACHE.get(path)
+    if hit is not None and hit[0] == key and key[0] is not None:
+        return hit[1]
+    data = _load(path)[0]  # not recorded in _MERGED: nobody saves this dict
+    _READ_CACHE[path] = (key, data)
+    return data
+
+
+def _merge_journal(path: Path, data: dict[str, Any], data_ino: int | None) -> dict[str, tuple[int, int, int]]:
+    merged: dict[str, tuple[int, int, int]] = {}
+    for jp in _journal_files(path):
+        try:
+            with open(jp, "rb") as f:
+                ino = os.fstat(f.fileno()).st_ino
+                raw = f.read()
+        except FileNotFoundError:
+            continue
+        # only whole lines: a trailing partial one may be an append still in progress
+        end = raw.rfind(b"\n") + 1
+        skip = 0
+        lines: list[tuple[int, bytes]] = []
+        pos = 0
+        for line in raw[:end].splitlines(keepends=True):
+            if line.startswith(_FOLD_PREFIX):
+                mark = _parse_fold_mark(line)
+                if mark is not None and mark[1] == data_ino:
+                    skip = mark[0]
+            else:
+                lines.append((pos, line))
+            pos += len(line)
+        for pos, line in lines:
+            if pos < skip:
+                continue
+            try:
+                rec = json.loads(line)
+                key, entry = rec["key"], rec["entry"]
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+                # torn write from an interrupted append
+                continue
+            bucket = data.setdefault(key, [])
+            if isinstance(bucket, list):
+                bucket.append(entry)
+        merged[jp.name] = (ino, end, len(raw))
+    return merged
+
+
+def _parse_fold_mark(line: bytes) -> tuple[int, int] | None:
+    try:
+        rec = json.loads(line)
+        folded, ino = rec["folded"], rec["ino"]
+    except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+        return None
+    if not isinstance(folded, int) or not isinstance(ino, int):
+        return None
+    return folded, ino
+
+
+def journal_status(path: Path) -> tuple[int, int]:
+    """(bytes in the journal files, entries in them the data file doesn't hold yet)."""
+    path = Path(path)
+    size = 0
+    for jp in _journal_files(path):
+        try:
+            size += os.stat(jp).st_size
+        except FileNotFoundError:
+            continue
+    if not size:
+        return 0, 0
+    key = _stat_key(path)
+    pending: dict[str, Any] = {}
+    _merge_journal(path, pending, key[0] if key is not None else None)
+    return size, sum(len(v) for v in pending.values() if isinstance(v, list))
+
+
+def _append_line(jp: Path, line: str, create: bool = True) -> tuple[os.stat_result, int, int]:
+    """
+    Append one line to journal jp: single write + fsync, created 0600; starts a fresh
+    line if an interrupted append left the last one unterminated.
+    Returns (stat before the write, size after it, bytes written).
+    """
+    flags = os.O_RDWR | os.O_APPEND | (os.O_CREAT if create else 0)
+    fd = os.open(jp, flags, 0o600)
+    try:
+        before = os.fstat(fd)
+        if before.st_size:
+            # O_APPEND writes still go to the end; the seek is only for this read
+            os.lseek(fd, -1, os.SEEK_END)
+            if os.read(fd, 1) != b"\n":
+                line = "\n" + line  # don't glue this line onto a torn one
+        payload = line.encode("utf-8")
+        os.write(fd, payload)
+        os.fsync(fd)
+        after = os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+    return before, after, len(payload)
+
+
+def append_entry(path: Path, key: str, entry: dict[str, Any], into: dict[str, Any] | None = None) -> bool:
+    """
+    Cheap add:
+    - appends one {"key", "entry"} line to the journal next to the data file
+    - single write + fsync, created 0600
+    - starts a fresh line if an interrupted append left the last one unterminated
+    The next load_json merges it; the next save_json folds it into the data file.
+    Without `into`, a journal grown past _JOURNAL_COMPACT_BYTES is folded in right away.
+
+    into: the dict load_json last returned for path, kept in memory by the caller.
+    The entry is added to into[key] too. Returns False if anything else wrote the files
+    since that load: into no longer matches them and should be re-read, not saved.
+    """
+    path = Path(path)
+    _ensure_parent(path)
+
+    live = _journal_path(path)
+    line = json.dumps({"key": key, "entry": entry}, sort_keys=True, ensure_ascii=False) + "\n"
+    before, after, written = _append_line(live, line)
+
+    if into is None:
+        if after > _JOURNAL_COMPACT_BYTES:
+            save_json(path, load_json(path))
+        return True
+    bucket = into.setdefault(key, [])
+    if isinstance(bucket, list):
+        bucket.append(entry)
+    rec = _MERGED.get(path)
+    if rec is None or rec[0] is not into or rec[1] != _stat_key(path):
+        return False
+    seen = rec[2].get(live.name)
+    if seen is None:
+        unchanged = before.st_size == 0  # no journal at load: this append started it
+    else:
+        unchanged = (seen[0], seen[2]) == (before.st_ino, before.st_size)
+    if not unchanged or after != before.st_size + written:
+        return False  # other lines reached the journal since the load, or alongside this one
+    rec[2][live.name] = (before.st_ino, after, after)
+    return True
 
 
 def save_json(path: Path, data: Any) -> None:
@@ -50,27 +267,98 @@ def save_json(path: Path, data: Any) -> None:
     - flush + fsync
     - os.replace to target
     - chmod 0600 best-effort
+    - folds in the journal lines `data` holds: when it is the dict load_json last returned,
+      exactly the ones that load merged; any other dict replaces the journals wholesale
+    Appends that load didn't see stay in their journal for the next load_json.
     """
     path = Path(path)
+    _READ_CACHE.pop(path, None)
+    rec = _MERGED.get(path)
+    known = rec[2] if rec is not None and rec[0] is data else None
+
+    # Set the live journal aside first: new appends start a fresh one, and one that is
+    # fully folded can be removed later without racing an append to it.
+    live = _journal_path(path)
+    held: dict[Path, tuple[int, int]] = {}
+    for jp in _journal_files(path):
+        try:
+            st = os.stat(jp)
+        except FileNotFoundError:
+            continue
+        if known is None:
+            n = st.st_size if isinstance(data, dict) else 0  # non-dict data loads as {}
+        else:
+            seen = known.get(jp.name)
+            n = seen[1] if seen is not None and seen[0] == st.st_ino else 0
+        if jp == live:
+            aside = live.with_name(f"{live.name}.{time.time_ns():020d}")
+            try:
+                os.rename(live, aside)
+                jp = aside
+            except FileNotFoundError:
+                continue
+            except OSError:
+                pass  # e.g. held open on Windows: fold it under its live name this time
+        held[jp] = (st.st_ino, n)
+
+    tmp = _write_tmp(path, data)
+    data_ino = os.stat(tmp).st_ino  # os.replace keeps it: the inode of the new data file
+    kept: dict[str, tuple[int, int, int]] = {}
+    for jp, (ino, n) in held.items():
+        # marked even when n is 0, so an older mark can't match a later data file that reuses its inode
+        mark = json.dumps({"folded": n, "ino": data_ino}, sort_keys=True) + "\n"
+        try:
+            before, after, written = _append_line(jp, mark, create=False)
+        except FileNotFoundError:
+            continue
+        # the mark line holds no entries: count it as held when nothing landed before it
+        end = after if after == n + written and before.st_ino == ino else n
+        kept[jp.name] = (ino, end, end)
+    _replace(tmp, path)
+
+    # Journals the data now holds in full can go. One set aside just now waits for the
+    # next save, in case an append that opened it before the rename is still writing.
+    if known is not None:
+        for name, (ino, n, _) in list(kept.items()):
+            jp = path.with_name(name)
+            if name not in known or known[name][0] != ino:
+                continue
+            try:
+                st = os.stat(jp)
+                if st.st_ino == ino and st.st_size == n:
+                    jp.unlink()
+                    del kept[name]
+            except FileNotFoundError:
+                del kept[name]
+    if isinstance(data, dict):
+        _MERGED[path] = (data, _stat_key(path), kept)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    _replace(_write_tmp(path, data), path)
+
+
+def _write_tmp(path: Path, data: Any) -> Path:
     _ensure_parent(path)
 
     tmp = path.with_name(path.name + ".tmp")
 
-    payload = (
-        json.dumps(
-            data,
-            indent=2,
-            sort_keys=True,
-            ensure_ascii=False,
-        )
-        + "\n"
+    payload = json.dumps(
+        data,
+        indent=2,
+        sort_keys=True,
+        ensure_ascii=False,
     )
 
     with open(tmp, "w", encoding="utf-8") as f:
         f.write(payload)
+        f.write("\n")
         f.flush()
         os.fsync(f.fileno())
+    return tmp
+
 
+def _replace(tmp: Path, path: Path) -> None:
     os.replace(tmp, path)
 
     try:
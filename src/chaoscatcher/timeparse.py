@@ -2,15 +2,73 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 
 def _now_local() -> datetime:
     return datetime.now().astimezone()
 
 
+# Regex equivalents of the strptime directives used below: the same sub-patterns
+# _strptime builds (C locale), so a fullmatch here is exactly a strptime() success
+# without strptime's per-format regex lookup and exception on every miss.
+_DIRECTIVES = {
+    "%Y": r"(?P<Y>\d\d\d\d)",
+    "%m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "%d": r"(?P<d>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "%H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "%I": r"(?P<I>1[0-2]|0[1-9]|[1-9])",
+    "%M": r"(?P<M>[0-5]\d|\d)",
+    "%p": r"(?P<p>am|pm)",
+}
+
+
+def _compile_format(fmt: str) -> re.Pattern[str]:
+    def piece(m: re.Match[str]) -> str:
+        tok = m.group()
+        if tok in _DIRECTIVES:
+            return _DIRECTIVES[tok]
+        return r"\s+" if tok.isspace() else re.escape(tok)
+
+    return re.compile(re.sub(r"%[YmdHIMp]|\s+|.", piece, fmt), re.IGNORECASE)
+
+
+# Candidates grouped by shape so only formats that could match are tried:
+# date+time by (date separator, has am/pm suffix), time-only by has am/pm suffix.
+_DATE_TIME_RES = {
+    shape: [_compile_format(fmt) for fmt in fmts]
+    for shape, fmts in {
+        ("-", True): ("%Y-%m-%d %I:%M%p", "%Y-%m-%d %I:%M %p", "%Y-%m-%d %I%p"),
+        ("-", False): ("%Y-%m-%d %H:%M",),
+        ("/", True): ("%Y/%m/%d %I:%M%p", "%Y/%m/%d %I:%M %p"),
+        ("/", False): ("%Y/%m/%d %H:%M",),
+    }.items()
+}
+
+_TIME_ONLY_RES = {
+    True: [_compile_format(fmt) for fmt in ("%I:%M%p", "%I:%M %p", "%I%p")],
+    False: [_compile_format("%H:%M")],
+}
+
+
+def _has_ampm(s: str) -> bool:
+    return s[-2:].lower() in ("am", "pm")
+
+
+def _hour_minute(m: re.Match[str]) -> tuple[int, int]:
+    """24h (hour, minute) from a _compile_format match, with strptime's %I/%p rules."""
+    g = m.groupdict()
+    if g.get("I") is not None:
+        hour = int(g["I"]) % 12
+        if g["p"].lower() == "pm":
+            hour += 12
+    else:
+        hour = int(g["H"])
+    return hour, int(g.get("M") or 0)
+
+
 def _with_local_tz(dt: datetime) -> datetime:
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=_now_local().tzinfo)
+    # naive input is local wall time: astimezone() gives it that date's offset
     return dt.astimezone()
 
 
@@ -29,16 +87,22 @@ def parse_ts(value: str | None) -> str:
     if not value or not value.strip():
         return _now_local().isoformat(timespec="seconds")
 
-    s = value.strip().lower()
+    raw = value.strip()
 
-    # --- 1) ISO 8601 ---
-    try:
-        dt = datetime.fromisoformat(value.strip())
-        dt = _with_local_tz(dt)
-        return dt.isoformat(timespec="seconds")
-    except ValueError:
-        pass
+    # --- 0) Bare times ("7:34am", "19:34") are the common --time input; none of the
+    # absolute formats can match without a date separator, so try them first ---
+    if raw[0].isdigit() and "-" not in raw and "/" not in raw:
+        try:
+            return _parse_time_only(raw, _now_local()).isoformat(timespec="seconds")
+        except ValueError:
+            pass
 
+    # --- 1) Absolute inputs (ISO 8601, date + time) ---
+    iso = _parse_absolute(raw)
+    if iso is not None:
+        return iso
+
+    s = raw.lower()
     now = _now_local()
 
     # --- 2) Relative like "3 days ago", "2 hours ago", "15 minutes ago" ---
@@ -70,27 +134,9 @@ def parse_ts(value: str | None) -> str:
         dt_time = _parse_time_only(rest, base)
         return dt_time.isoformat(timespec="seconds")
 
-    # --- 4) Date + time formats ---
-    dt_formats = [
-        "%Y-%m-%d %I:%M%p",
-        "%Y-%m-%d %I:%M %p",
-        "%Y-%m-%d %I%p",
-        "%Y-%m-%d %H:%M",
-        "%Y/%m/%d %I:%M%p",
-        "%Y/%m/%d %I:%M %p",
-        "%Y/%m/%d %H:%M",
-    ]
-    for fmt in dt_formats:
-        try:
-            dt = datetime.strptime(value.strip(), fmt)
-            dt = dt.replace(tzinfo=now.tzinfo)
-            return dt.isoformat(timespec="seconds")
-        except ValueError:
-            continue
-
-    # --- 5) Time-only formats (assume today) ---
+    # --- 4) Time-only formats (assume today) ---
     try:
-        dt = _parse_time_only(value.strip(), now)
+        dt = _parse_time_only(raw, now)
         return dt.isoformat(timespec="seconds")
     except ValueError:
         pass
@@ -101,6 +147,36 @@ def parse_ts(value: str | None) -> str:
     )
 
 
+@lru_cache(maxsize=256)
+def _parse_absolute(value: str) -> str | None:
+    """
+    ISO 8601 and explicit date + time inputs.
+    These do not depend on the current time, so results are memoized; relative
+    inputs ("today 9am", "3 days ago") must never go through this cache.
+    Returns None if value is not an absolute timestamp.
+    """
+    if value[:4].isdigit():  # every ISO form starts with the year
+        try:
+            dt = datetime.fromisoformat(value)
+            dt = _with_local_tz(dt)
+            return dt.isoformat(timespec="seconds")
+        except ValueError:
+            pass
+
+    for rx in _DATE_TIME_RES.get((value[4:5], _has_ampm(value)), ()):
+        m = rx.fullmatch(value)
+        if m is None:
+            continue
+        hour, minute = _hour_minute(m)
+        try:
+            dt = datetime(int(m["Y"]), int(m["m"]), int(m["d"]), hour, minute).astimezone()
+        except ValueError:  # e.g. Feb 30: every format would reject it
+            return None
+        return dt.isoformat(timespec="seconds")
+
+    return None
+
+
 def _parse_time_only(time_str: str, base_dt: datetime) -> datetime:
     """
     Parse a time like '9am', '7:34am', '14:30' and apply it to base_dt's date.
@@ -108,18 +184,10 @@ def _parse_time_only(time_str: str, base_dt: datetime) -> datetime:
     """
     s = time_str.strip().lower()
 
-    t_formats = [
-        "%I:%M%p",
-        "%I:%M %p",
-        "%I%p",
-        "%H:%M",
-    ]
-    for fmt in t_formats:
-        try:
-            t = datetime.strptime(s, fmt)
-            dt = base_dt.replace(hour=t.hour, minute=t.minute, second=0, microsecond=0)
-            return dt
-        except ValueError:
-            continue
+    for rx in _TIME_ONLY_RES[_has_ampm(s)]:
+        m = rx.fullmatch(s)
+        if m is not None:
+            hour, minute = _hour_minute(m)
+            return base_dt.replace(hour=hour, minute=minute, second=0, microsecond=0)
 
     raise ValueError(f"Could not parse time-only value: {time_str!r}")
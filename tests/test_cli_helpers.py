@@ -2,9 +2,26 @@
 
 from __future__ import annotations
 
+import time
+from datetime import datetime, timedelta, timezone
+
 import pytest
 
-from chaoscatcher.cli import _parse_minutes, _parse_tags, _sparkline
+from chaoscatcher._util import _daily_slope, _dt_from_entry_ts, _fmt_time, _parse_entry_ts
+from chaoscatcher.cli import (
+    _dated_entries,
+    _fmt_utcoffset,
+    _join_tags,
+    _mood_key,
+    _parse_minutes,
+    _parse_tags,
+    _recent_score_days,
+    _requested_command,
+    _requested_leaf,
+    _scored_entries,
+    _sparkline,
+    _today_entries,
+)
 
 # ---- _parse_minutes ----
 
@@ -88,6 +105,32 @@ def test_parse_tags_preserves_order():
     assert result == ["c", "b", "a"]
 
 
+# ---- _mood_key ----
+
+
+def test_mood_key_ignores_tag_order_and_case():
+    a = {"ts": "2026-01-01T09:00:00-05:00", "score": 7, "tags": ["Work", " gym"]}
+    b = {"ts": "2026-01-01T09:00:00-05:00", "score": 7, "tags": ["gym", "work"]}
+    assert _mood_key(a) == _mood_key(b)
+
+
+def test_mood_key_matches_for_stored_and_computed_tags_norm():
+    legacy = {"ts": "2026-01-01T09:00:00-05:00", "score": 7, "tags": ["Work", "gym"]}
+    added = {**legacy, "_tags_norm": ["gym", "work"]}
+    assert _mood_key(added) == _mood_key(legacy)
+
+
+def test_mood_key_tolerates_unhashable_tags():
+    entry = {"ts": "2026-01-01T09:00:00-05:00", "score": 7, "tags": [["odd"], "work"]}
+    assert _mood_key(entry)[3] == ("['odd']", "work")
+
+
+def test_tags_equal_by_value_are_not_confused():
+    keys = [_mood_key({"ts": "2026-01-01T09:00:00-05:00", "score": 7, "tags": [t]})[3] for t in (1, True, 1.0)]
+    assert keys == [("1",), ("true",), ("1.0",)]
+    assert _join_tags([True]) == "True"
+
+
 # ---- _sparkline ----
 
 
@@ -115,3 +158,202 @@ def test_sparkline_custom_range():
     result = _sparkline([0.0, 100.0], vmin=0.0, vmax=100.0)
     assert result[0] == "▁"
     assert result[1] == "█"
+
+
+# ---- _daily_slope ----
+
+
+def test_daily_slope_single_point_is_zero():
+    assert _daily_slope([5.0]) == 0.0
+
+
+def test_daily_slope_linear():
+    assert _daily_slope([1.0, 2.0, 3.0, 4.0]) == pytest.approx(1.0)
+
+
+def test_daily_slope_matches_least_squares():
+    ys = [5.0, 7.0, 4.0, 8.0, 6.5]
+    n = len(ys)
+    x_mean = sum(range(n)) / n
+    y_mean = sum(ys) / n
+    num = sum((x - x_mean) * (y - y_mean) for x, y in zip(range(n), ys))
+    den = sum((x - x_mean) ** 2 for x in range(n))
+    assert _daily_slope(ys) == pytest.approx(num / den)
+
+
+# ---- _today_entries ----
+
+
+def _entry(dt: datetime) -> dict:
+    return {"ts": dt.isoformat(timespec="seconds")}
+
+
+def test_today_entries_sorted_log():
+    now = datetime.now().astimezone().replace(hour=12, minute=0, second=0, microsecond=0)
+    entries = [_entry(now - timedelta(days=d)) for d in (30, 5, 1)] + [_entry(now), _entry(now)]
+    result = _today_entries(entries, now.date())
+    assert [m for _, m in result] == entries[3:]
+
+
+def test_today_entries_backdated_entry_does_not_hide_today():
+    now = datetime.now().astimezone().replace(hour=12, minute=0, second=0, microsecond=0)
+    today = _entry(now)
+    backdated = _entry(now - timedelta(days=3))
+    entries = [_entry(now - timedelta(days=10)), today, backdated]
+    result = _today_entries(entries, now.date())
+    assert [m for _, m in result] == [today]
+
+
+def test_today_entries_keeps_ts_ties_in_input_order():
+    now = datetime.now().astimezone().replace(hour=12, minute=0, second=0, microsecond=0)
+    a, b, c = ({**_entry(now), "n": i} for i in range(3))
+    entries = [_entry(now - timedelta(days=1)), _entry(now.replace(hour=9)), a, b, c]
+    result = _today_entries(entries, now.date())
+    assert [m for _, m in result] == entries[1:]
+
+
+def test_today_entries_other_utc_offset():
+    now = datetime.now().astimezone().replace(hour=12, minute=0, second=0, microsecond=0)
+    far = now.astimezone(timezone(now.utcoffset() + timedelta(hours=10)))
+    entries = [_entry(far), _entry(now - timedelta(days=1))]
+    result = _today_entries(entries, now.date())
+    assert [m for _, m in result] == entries[:1]
+
+
+def test_today_entries_midnight_edges():
+    day = datetime.now().astimezone().date()
+    first = datetime.combine(day, datetime.min.time()).astimezone()
+    last = datetime.combine(day, datetime.max.time()).astimezone().replace(microsecond=0)
+    entries = [_entry(first - timedelta(seconds=1)), _entry(first), _entry(last), _entry(last + timedelta(seconds=1))]
+    result = _today_entries(entries, day)
+    assert [m for _, m in result] == entries[1:3]
+
+
+# ---- _recent_score_days ----
+
+
+def test_recent_score_days_sorted_log_keeps_newest_days():
+    now = datetime.now().astimezone().replace(hour=12, minute=0, second=0, microsecond=0)
+    entries = [{**_entry(now - timedelta(days=d)), "score": d % 10 + 1} for d in range(20, -1, -1)]
+    entries.append({**_entry(now), "score": 99})
+    result = _recent_score_days(entries, 3)
+    assert result == {(now - timedelta(days=d)).date().isoformat(): [d % 10 + 1] for d in range(3)}
+
+
+def test_recent_score_days_unsorted_log():
+    now = datetime.now().astimezone().replace(hour=12, minute=0, second=0, microsecond=0)
+    entries = [{**_entry(now - timedelta(days=d)), "score": 5} for d in (1, 9, 0, 4)]
+    days = [(now - timedelta(days=d)).date().isoformat() for d in (0, 1)]
+    assert list(_recent_score_days(entries, 2)) == days
+
+
+# ---- _dated_entries ----
+
+
+def test_dated_entries_cutoff_on_sorted_log():
+    now = datetime.now().astimezone().replace(microsecond=0)
+    entries = [_entry(now - timedelta(days=d)) for d in (40, 20, 9, 3, 0)]
+    cutoff = now - timedelta(days=10)
+    assert [m for _, m in _dated_entries(entries, cutoff)] == entries[2:]
+
+
+def test_dated_entries_cutoff_on_unsorted_log():
+    now = datetime.now().astimezone().replace(microsecond=0)
+    entries = [_entry(now - timedelta(days=d)) for d in (40, 3, 20, 0, 9)]
+    cutoff = now - timedelta(days=10)
+    assert [m for _, m in _dated_entries(entries, cutoff)] == [entries[1], entries[3], entries[4]]
+
+
+# ---- _scored_entries ----
+
+
+def test_scored_entries_accepts_padded_ts():
+    now = datetime.now().astimezone().replace(microsecond=0)
+    padded = {"ts": f"  {now.isoformat()}\n", "score": 6}
+    entries = [{"ts": (now - timedelta(days=40)).isoformat(), "score": 5}, padded]
+    assert [m for _, _, m in _scored_entries(entries, now - timedelta(days=7))] == [padded]
+
+
+# ---- _fmt_utcoffset ----
+
+
+@pytest.mark.parametrize(
+    "offset",
+    [timedelta(0), timedelta(hours=-5), timedelta(hours=5, minutes=30), timedelta(hours=-9, minutes=-30)],
+)
+def test_fmt_utcoffset_matches_strftime(offset):
+    dt = datetime(2026, 1, 1, 9, 0, tzinfo=timezone(offset))
+    assert _fmt_utcoffset(dt.utcoffset()) == dt.strftime("%z")
+
+
+def test_fmt_utcoffset_naive():
+    assert _fmt_utcoffset(None) == ""
+
+
+# ---- _requested_command ----
+
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        (["med", "add", "--name", "x"], "med"),
+        (["--data", "mood", "where"], "where"),
+        (["--data=/tmp/x.json", "mood", "list"], "mood"),
+        (["--prof", "dev", "--allow-repo-data-path", "summary"], "summary"),
+        (["-h", "med"], None),
+        (["--he"], None),
+        (["--"], None),
+        ([], None),
+    ],
+)
+def test_requested_command(argv, expected):
+    assert _requested_command(argv) == expected
+
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        (["med", "add", "--name", "x"], "add"),
+        (["--profile", "mood", "mood", "export-daily"], "export-daily"),
+        (["med", "export-daily"], None),
+        (["mood", "-h", "list"], None),
+        (["where", "list"], None),
+        (["med"], None),
+    ],
+)
+def test_requested_leaf(argv, expected):
+    assert _requested_leaf(argv) == expected
+
+
+# ---- _fmt_time ----
+
+
+@pytest.mark.parametrize(
+    ("hour", "minute", "expected"),
+    [(0, 0, "12:00 AM"), (7, 5, "7:05 AM"), (12, 30, "12:30 PM"), (23, 59, "11:59 PM")],
+)
+def test_fmt_time(hour, minute, expected):
+    assert _fmt_time(datetime(2026, 1, 1, hour, minute)) == expected
+
+
+# ---- _dt_from_entry_ts ----
+
+
+@pytest.fixture
+def new_york_tz(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("needs time.tzset")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    _parse_entry_ts.cache_clear()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+    _parse_entry_ts.cache_clear()
+
+
+def test_naive_entry_ts_keeps_wall_time_with_its_own_dates_offset(new_york_tz):
+    winter = _dt_from_entry_ts("2026-01-15T09:00:00")
+    summer = _dt_from_entry_ts("2026-07-15T09:00:00")
+    assert (winter.hour, winter.utcoffset()) == (9, timedelta(hours=-5))
+    assert (summer.hour, summer.utcoffset()) == (9, timedelta(hours=-4))
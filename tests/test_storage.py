@@ -8,7 +8,8 @@ from pathlib import Path
 
 import pytest
 
-from chaoscatcher.storage import load_json, save_json
+from chaoscatcher import storage
+from chaoscatcher.storage import append_entry, journal_status, load_json, load_json_readonly, save_json
 
 
 @pytest.fixture()
@@ -67,6 +68,13 @@ def test_load_empty_file_returns_empty_dict(tmp_json):
     assert result == {}
 
 
+def test_load_whitespace_only_file_returns_empty_dict(tmp_json):
+    tmp_json.write_text("  \n\t\n", encoding="utf-8")
+    result = load_json(tmp_json)
+    assert result == {}
+    assert json.loads(tmp_json.read_text()) == {}
+
+
 def test_load_valid_json(tmp_json):
     save_json(tmp_json, {"moods": [], "water": []})
     result = load_json(tmp_json)
@@ -87,6 +95,161 @@ def test_load_non_dict_json_returns_empty(tmp_json):
     assert result == {}
 
 
+# ---- journal ----
+
+
+def _journal(path: Path) -> Path:
+    return path.with_name(path.name + ".journal")
+
+
+def test_append_entry_is_merged_on_load(tmp_json):
+    save_json(tmp_json, {"medications": [{"name": "A"}]})
+    append_entry(tmp_json, "medications", {"name": "B"})
+    append_entry(tmp_json, "moods", {"score": 5})
+    result = load_json(tmp_json)
+    assert result == {"medications": [{"name": "A"}, {"name": "B"}], "moods": [{"score": 5}]}
+
+
+def test_append_entry_without_data_file(tmp_json):
+    append_entry(tmp_json, "medications", {"name": "A"})
+    assert load_json(tmp_json) == {"medications": [{"name": "A"}]}
+    assert _journal(tmp_json).exists()
+
+
+def test_append_entry_sets_permissions(tmp_json):
+    append_entry(tmp_json, "medications", {"name": "A"})
+    mode = oct(os.stat(_journal(tmp_json)).st_mode & 0o777)
+    assert mode == "0o600"
+
+
+def _journals(path: Path) -> list[Path]:
+    return sorted(path.parent.glob(path.name + ".journal*"))
+
+
+def test_save_folds_journal_into_data_file(tmp_json):
+    append_entry(tmp_json, "medications", {"name": "A"})
+    save_json(tmp_json, load_json(tmp_json))
+    assert not _journal(tmp_json).exists()
+    assert json.loads(tmp_json.read_text()) == {"medications": [{"name": "A"}]}
+    assert load_json(tmp_json) == {"medications": [{"name": "A"}]}
+
+
+def test_folded_journal_is_not_merged_twice(tmp_json):
+    # the set-aside journal outlives the save that folded it, as after a crash before cleanup
+    append_entry(tmp_json, "moods", {"score": 1})
+    save_json(tmp_json, load_json(tmp_json))
+    assert _journals(tmp_json)
+    assert load_json(tmp_json) == {"moods": [{"score": 1}]}
+
+
+def test_save_interrupted_before_replace_keeps_entries(tmp_json, monkeypatch):
+    append_entry(tmp_json, "moods", {"score": 1})
+    data = load_json(tmp_json)
+
+    def crash(tmp, path):
+        raise OSError("power cut")
+
+    monkeypatch.setattr(storage, "_replace", crash)
+    with pytest.raises(OSError):
+        save_json(tmp_json, data)
+    monkeypatch.undo()
+    assert load_json(tmp_json) == {"moods": [{"score": 1}]}
+
+
+def test_recreated_data_file_gets_folded_entries_back(tmp_json):
+    append_entry(tmp_json, "moods", {"score": 1})
+    save_json(tmp_json, load_json(tmp_json))
+    tmp_json.unlink()  # the new file may reuse the old inode
+    assert load_json(tmp_json) == {"moods": [{"score": 1}]}
+
+
+def test_next_save_removes_folded_journals(tmp_json):
+    append_entry(tmp_json, "moods", {"score": 1})
+    save_json(tmp_json, load_json(tmp_json))
+    save_json(tmp_json, load_json(tmp_json))
+    assert _journals(tmp_json) == []
+    assert load_json(tmp_json) == {"moods": [{"score": 1}]}
+
+
+def test_save_keeps_appends_made_after_load(tmp_json):
+    data = load_json(tmp_json)
+    append_entry(tmp_json, "moods", {"score": 1})  # e.g. the CLI, while the GUI holds data
+    data["water"] = [{"oz": 8}]
+    save_json(tmp_json, data)
+    assert load_json(tmp_json) == {"water": [{"oz": 8}], "moods": [{"score": 1}]}
+    save_json(tmp_json, load_json(tmp_json))
+    save_json(tmp_json, load_json(tmp_json))
+    assert load_json(tmp_json) == {"water": [{"oz": 8}], "moods": [{"score": 1}]}
+
+
+def test_append_into_loaded_dict_is_folded_once(tmp_json):
+    data = load_json(tmp_json)
+    assert append_entry(tmp_json, "moods", {"score": 1}, into=data)
+    assert data == {"moods": [{"score": 1}]}
+    save_json(tmp_json, data)
+    assert append_entry(tmp_json, "moods", {"score": 2}, into=data)
+    save_json(tmp_json, data)
+    assert load_json(tmp_json) == {"moods": [{"score": 1}, {"score": 2}]}
+
+
+def test_append_into_reports_other_writers(tmp_json):
+    data = load_json(tmp_json)
+    append_entry(tmp_json, "moods", {"score": 1})
+    assert not append_entry(tmp_json, "moods", {"score": 2}, into=data)
+    assert load_json(tmp_json) == {"moods": [{"score": 1}, {"score": 2}]}
+
+
+def test_append_compacts_a_large_journal(tmp_json, monkeypatch):
+    monkeypatch.setattr(storage, "_JOURNAL_COMPACT_BYTES", 100)
+    for i in range(4):
+        append_entry(tmp_json, "moods", {"score": i})
+    assert len(json.loads(tmp_json.read_text())["moods"]) >= 3
+    assert _journal(tmp_json).stat().st_size <= 100
+    assert load_json(tmp_json) == {"moods": [{"score": i} for i in range(4)]}
+
+
+def test_load_skips_torn_journal_line(tmp_json):
+    append_entry(tmp_json, "medications", {"name": "A"})
+    with open(_journal(tmp_json), "a", encoding="utf-8") as f:
+        f.write('{"key": "medications", "ent')
+    assert load_json(tmp_json) == {"medications": [{"name": "A"}]}
+
+
+def test_append_after_torn_line_is_kept(tmp_json):
+    with open(_journal(tmp_json), "a", encoding="utf-8") as f:
+        f.write('{"key": "moods", "ent')
+    append_entry(tmp_json, "moods", {"score": 1})
+    assert load_json(tmp_json) == {"moods": [{"score": 1}]}
+
+
+def test_journal_status_counts_unfolded_entries(tmp_json):
+    assert journal_status(tmp_json) == (0, 0)
+    append_entry(tmp_json, "moods", {"score": 1})
+    append_entry(tmp_json, "moods", {"score": 2})
+    size, pending = journal_status(tmp_json)
+    assert size > 0 and pending == 2
+    save_json(tmp_json, load_json(tmp_json))
+    assert journal_status(tmp_json)[1] == 0
+
+
+# ---- load_json_readonly ----
+
+
+def test_readonly_load_reuses_parse_until_file_changes(tmp_json):
+    save_json(tmp_json, {"moods": [1]})
+    first = load_json_readonly(tmp_json)
+    assert load_json_readonly(tmp_json) is first
+    save_json(tmp_json, {"moods": [2]})
+    assert load_json_readonly(tmp_json) == {"moods": [2]}
+
+
+def test_readonly_load_sees_journal_appends(tmp_json):
+    save_json(tmp_json, {"moods": []})
+    load_json_readonly(tmp_json)
+    append_entry(tmp_json, "moods", {"score": 5})
+    assert load_json_readonly(tmp_json) == {"moods": [{"score": 5}]}
+
+
 # ---- round-trip ----
 
 
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import re
+import time
 from datetime import datetime, timedelta
 
 import pytest
 
+from chaoscatcher import timeparse
 from chaoscatcher.timeparse import parse_ts
 
 
@@ -106,6 +108,17 @@ def test_tomorrow_with_time():
     assert result.hour == 19
 
 
+def test_keyword_input_is_not_memoized(monkeypatch):
+    day1 = datetime(2026, 1, 10, 12, 0).astimezone()
+    day2 = datetime(2026, 1, 11, 12, 0).astimezone()
+    monkeypatch.setattr(timeparse, "_now_local", lambda: day1)
+    first = _parse("today 9am")
+    monkeypatch.setattr(timeparse, "_now_local", lambda: day2)
+    second = _parse("today 9am")
+    assert first.date() == day1.date()
+    assert second.date() == day2.date()
+
+
 # ---- Time-only (assumes today) ----
 
 
@@ -132,6 +145,11 @@ def test_time_only_hour_only():
     assert result.hour == 9
 
 
+def test_basic_iso_date_is_not_taken_as_time_only():
+    result = _parse("20260225T0734")
+    assert (result.year, result.month, result.day, result.hour, result.minute) == (2026, 2, 25, 7, 34)
+
+
 # ---- Date + time formats ----
 
 
@@ -150,6 +168,22 @@ def test_date_plus_time_ampm():
     assert result.minute == 34
 
 
+@pytest.mark.parametrize("value", ["2026-{}-15T09:00:00", "2026-{}-15 09:00"])
+def test_naive_input_gets_the_offset_of_its_own_date(monkeypatch, value):
+    if not hasattr(time, "tzset"):
+        pytest.skip("needs time.tzset")
+    monkeypatch.setenv("TZ", "America/New_York")
+    time.tzset()
+    timeparse._parse_absolute.cache_clear()
+    try:
+        assert parse_ts(value.format("01")) == "2026-01-15T09:00:00-05:00"
+        assert parse_ts(value.format("07")) == "2026-07-15T09:00:00-04:00"
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+        timeparse._parse_absolute.cache_clear()
+
+
 # ---- Return format ----
 
 